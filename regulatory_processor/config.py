@@ -1,7 +1,7 @@
 """Configuration classes and constants for the regulatory processor."""
 
 from dataclasses import dataclass, field
-from typing import NamedTuple, List, Tuple
+from typing import NamedTuple, List, Optional, Tuple
 
 
 # =============================================================================
@@ -36,11 +36,16 @@ class SectionTypes:
 class ProcessingConfig:
     """Configuration settings for document processing."""
     create_backups: bool = True
+    link_backups: bool = True  # Hard-link backups when possible; edits to the source in place would show in the backup
     convert_to_pdf: bool = True
     overwrite_existing: bool = False
     log_level: str = "INFO"
     country_delimiter: str = ";"
     skip_pdf_in_background: bool = False  # Skip PDF conversion in ThreadPoolExecutor context
+    parallel_documents: bool = False  # Process input documents in a process pool
+    document_workers: Optional[int] = None  # Pool size; None means CPU count - 1
+    pdf_workers: int = 1  # Concurrent LibreOffice conversions in the PDF batch
+    pdf_batch_size: int = 10  # Documents per LibreOffice invocation; 1 converts one at a time
 
 
 @dataclass
@@ -3,10 +3,16 @@
 import locale
 import re
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 
+from .utils import load_mapping_table_cached
+
+
+# Single "d" day token followed by a dot (not the tail of "dd")
+_DAY_DOT_RE = re.compile(r'(?<!d)d\.')
+
 
 class DateFormatterSystem:
     """
@@ -21,25 +27,35 @@ class DateFormatterSystem:
         Args:
             mapping_file_path: Path to the Excel mapping file
         """
-        self.mapping_df = pd.read_excel(mapping_file_path)
+        # The processor loads the same workbook; share its parsed table while
+        # the file is unchanged. A failed load re-reads here to raise the error.
+        self.mapping_df = load_mapping_table_cached(mapping_file_path)
+        if self.mapping_df is None:
+            self.mapping_df = pd.read_excel(mapping_file_path)
         self.country_formats = self._load_country_formats()
         self.locale_mapping = self._create_locale_mapping()
+        # Formatted dates keyed by (country, annex_type, calendar date)
+        self._format_cache: Dict[tuple, str] = {}
+        # Full and abbreviated month names per locale code, filled on first use
+        self._month_tables: Dict[str, Tuple[List[str], List[str]]] = {}
+        # Format string and resolved month names keyed by (country, annex_type)
+        self._format_plans: Dict[tuple, Tuple[str, List[str]]] = {}
 
     def _load_country_formats(self) -> Dict[str, Dict[str, str]]:
         """Load date formats from the mapping table."""
-        formats = {}
-
-        for _, row in self.mapping_df.iterrows():
-            country = row['Country']
-            annex_i_format = row.get('Annex I Date Format', '')
-            annex_iiib_format = row.get('Annex IIIB Date Format', '')
-
-            formats[country] = {
-                'annex_i': annex_i_format,
-                'annex_iiib': annex_iiib_format
-            }
-
-        return formats
+        df = self.mapping_df
+        countries = df['Country'].tolist()
+        blanks = [''] * len(countries)
+        annex_i_formats = (df['Annex I Date Format'].tolist()
+                           if 'Annex I Date Format' in df.columns else blanks)
+        annex_iiib_formats = (df['Annex IIIB Date Format'].tolist()
+                              if 'Annex IIIB Date Format' in df.columns else blanks)
+
+        return {
+            country: {'annex_i': annex_i_format, 'annex_iiib': annex_iiib_format}
+            for country, annex_i_format, annex_iiib_format
+            in zip(countries, annex_i_formats, annex_iiib_formats)
+        }
 
     def _create_locale_mapping(self) -> Dict[str, str]:
         """Create a mapping between countries and their locale codes."""
@@ -74,64 +90,110 @@ class DateFormatterSystem:
         }
         return locale_map
 
-    def _get_month_name(self, date: datetime, country: str, format_type: str) -> str:
-        """Get the month name in the appropriate language and case for the country."""
-        try:
-            # Set locale for the country
-            country_locale = self.locale_mapping.get(country, 'en_US.UTF-8')
+    def _get_month_names(self, country_locale: str) -> Tuple[List[str], List[str]]:
+        """
+        Return (full, abbreviated) month names for a locale, indexed 1-12.
 
+        The locale is switched only while the table is built and then
+        restored, so formatting never leaves LC_TIME changed process-wide.
+        """
+        tables = self._month_tables.get(country_locale)
+        if tables is not None:
+            return tables
+
+        previous = locale.setlocale(locale.LC_TIME)
+        try:
             # Try to set the locale, fall back to English if not available
             try:
                 locale.setlocale(locale.LC_TIME, country_locale)
             except locale.Error:
-                locale.setlocale(locale.LC_TIME, 'en_US.UTF-8')
-
-            # Determine the case based on format
-            if 'Month' in format_type:  # Capital M
-                month_name = date.strftime('%B')  # Full month name
-            elif 'MMM' in format_type:  # Three letter abbreviation
-                month_name = date.strftime('%b')  # Abbreviated month name
-            else:  # 'month' - lowercase
-                month_name = date.strftime('%B').lower()
-
-            return month_name
-
-        except Exception:
-            # Fallback to English month names
-            month_names = {
-                'Month': date.strftime('%B'),
-                'month': date.strftime('%B').lower(),
-                'MMM': date.strftime('%b')
-            }
+                try:
+                    locale.setlocale(locale.LC_TIME, 'en_US.UTF-8')
+                except locale.Error:
+                    pass  # Use the current locale's names
+
+            months = [datetime(2000, month, 1) for month in range(1, 13)]
+            full = [''] + [month.strftime('%B') for month in months]
+            abbreviated = [''] + [month.strftime('%b') for month in months]
+        finally:
+            locale.setlocale(locale.LC_TIME, previous)
+
+        tables = (full, abbreviated)
+        self._month_tables[country_locale] = tables
+        return tables
+
+    def _get_month_name_list(self, country: str, format_type: str) -> List[str]:
+        """Get the month names (indexed 1-12) in the language and case the format uses."""
+        country_locale = self.locale_mapping.get(country, 'en_US.UTF-8')
+        full, abbreviated = self._get_month_names(country_locale)
+
+        # Determine the case based on format
+        if 'Month' in format_type:  # Capital M
+            return full  # Full month name
+        elif 'MMM' in format_type:  # Three letter abbreviation
+            return abbreviated  # Abbreviated month name
+        else:  # 'month' - lowercase
+            return [name.lower() for name in full]
+
+    def _get_month_name(self, date: datetime, country: str, format_type: str) -> str:
+        """Get the month name in the appropriate language and case for the country."""
+        return self._get_month_name_list(country, format_type)[date.month]
 
-            if 'Month' in format_type:
-                return month_names['Month']
-            elif 'MMM' in format_type:
-                return month_names['MMM']
-            else:
-                return month_names['month']
+    def _get_format_plan(self, country: str, annex_type: str) -> Tuple[str, List[str]]:
+        """Get the format string and resolved month names for a country and annex.
+
+        Locale lookup and case selection depend only on the format, so they are
+        done once per (country, annex_type) rather than once per date.
+        """
+        plan_key = (country, annex_type)
+        plan = self._format_plans.get(plan_key)
+        if plan is None:
+            format_string = self.country_formats[country][annex_type]
+            month_names = (self._get_month_name_list(country, format_string)
+                           if format_string and isinstance(format_string, str) else [])
+            plan = (format_string, month_names)
+            self._format_plans[plan_key] = plan
+        return plan
 
     def _parse_custom_format(self, date: datetime, format_string: str, country: str) -> str:
         """Parse a custom format string and return the formatted date."""
         if not format_string:
             return ""
 
+        month_names = (self._get_month_name_list(country, format_string)
+                       if isinstance(format_string, str) else [])
+        return self._render_format(date, format_string, month_names)
+
+    @staticmethod
+    def _render_format(date: datetime, format_string: str, month_names: List[str]) -> str:
+        """Substitute the date into a format string using pre-resolved month names."""
+        if not format_string:
+            return ""
+
         result = format_string
 
+        # Literal tokens use str.replace; only the single-d lookbehind needs
+        # the regex engine
+
         # Handle year formats
-        result = re.sub(r'yyyy', str(date.year), result)
+        result = result.replace('yyyy', str(date.year))
 
         # Handle month formats (do this before day to avoid conflicts)
-        month_name = self._get_month_name(date, country, format_string)
-        result = re.sub(r'Month|month|MMM', month_name, result)
+        month_name = month_names[date.month]
+        # MMM first so an overlap such as 'MMMonth' resolves leftmost, as a
+        # single Month|month|MMM pass would
+        result = result.replace('MMM', month_name)
+        result = result.replace('Month', month_name)
+        result = result.replace('month', month_name)
 
         # Handle numeric month formats
-        result = re.sub(r'mm', f"{date.month:02d}", result)
-        result = re.sub(r'MM', f"{date.month:02d}", result)
+        month_digits = f"{date.month:02d}"
+        result = result.replace('mm', month_digits)
+        result = result.replace('MM', month_digits)
 
         # Handle day formats
-        result = re.sub(r'dd', f"{date.day:02d}", result)
-        result = re.sub(r'(?<!d)d\.', f"{date.day}.", result)  # Handle single d followed by dot
+        result = result.replace('dd', f"{date.day:02d}")
+        result = _DAY_DOT_RE.sub(f"{date.day}.", result)  # Handle single d followed by dot
 
         return result.strip()
 
@@ -143,8 +205,14 @@ class DateFormatterSystem:
         if annex_type not in ['annex_i', 'annex_iiib']:
             raise ValueError("annex_type must be 'annex_i' or 'annex_iiib'")
 
-        format_string = self.country_formats[country][annex_type]
-        return self._parse_custom_format(date, format_string, country)
+        # Formats only use the calendar date, so the time of day is not part of the key
+        cache_key = (country, annex_type, date.year, date.month, date.day)
+        formatted = self._format_cache.get(cache_key)
+        if formatted is None:
+            format_string, month_names = self._get_format_plan(country, annex_type)
+            formatted = self._render_format(date, format_string, month_names)
+            self._format_cache[cache_key] = formatted
+        return formatted
 
     def get_available_countries(self) -> List[str]:
         """Get list of available countries in the mapping table."""
@@ -184,11 +252,15 @@ class DateFormatterSystem:
 # Global date formatter instance
 _date_formatter: Optional[DateFormatterSystem] = None
 
+# Formatted "today" strings keyed by (country, annex_type, day); reset on re-initialization
+_date_cache: Dict[tuple, str] = {}
+
 
 def initialize_date_formatter(mapping_file_path: str) -> DateFormatterSystem:
     """Initialize the global date formatter."""
     global _date_formatter
     _date_formatter = DateFormatterSystem(mapping_file_path)
+    _date_cache.clear()
     return _date_formatter
 
 
@@ -201,13 +273,25 @@ def get_date_formatter() -> DateFormatterSystem:
 
 
 def format_date_for_country(country: str, annex_type: str, date: Optional[datetime] = None) -> str:
-    """Format a date using the enhanced DateFormatterSystem."""
+    """Format a date using the enhanced DateFormatterSystem.
+
+    Results for the current date are memoized per (country, annex_type) until
+    the day changes or the formatter is re-initialized.
+    """
+    cache_key = None
     if date is None:
         date = datetime.now()
+        cache_key = (country, annex_type, date.date())
+        cached = _date_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
     try:
         formatter = get_date_formatter()
-        return formatter.format_date(date, country, annex_type)
+        formatted = formatter.format_date(date, country, annex_type)
+        if cache_key is not None:
+            _date_cache[cache_key] = formatted
+        return formatted
     except Exception as e:
         print(f"⚠️ Error formatting date for {country} ({annex_type}): {e}")
         # Fallback to simple formatting
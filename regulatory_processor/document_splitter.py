@@ -178,7 +178,9 @@ def find_annex_boundaries(doc: Document, target_annex: str, all_annex_headers: L
     """
     print(f"🔍 FINDING BOUNDARIES FOR: '{target_annex}'")
     print(f"🎯 is_annex_i: {is_annex_i}")
-    print(f"📄 Document has {len(doc.paragraphs)} paragraphs")
+    # doc.paragraphs rebuilds its list on every access; read paragraphs and their text once
+    raw_texts = [para.text for para in doc.paragraphs]
+    print(f"📄 Document has {len(raw_texts)} paragraphs")
 
     start_idx = None
     end_idx = None
@@ -200,10 +202,10 @@ def find_annex_boundaries(doc: Document, target_annex: str, all_annex_headers: L
     # First pass: log all annex-related paragraphs for debugging (REDUCED for performance)
     print("🔍 SCANNING DOCUMENT FOR ANNEX HEADERS...")
     annex_paragraphs = []
-    for i, para in enumerate(doc.paragraphs):
-        para_text = normalize_text(para.text)
+    normalized_texts = [normalize_text(text) for text in raw_texts]
+    for i, para_text in enumerate(normalized_texts):
         if "ANNEX" in para_text or "ANEXO" in para_text:
-            annex_paragraphs.append((i, para.text.strip(), para_text))
+            annex_paragraphs.append((i, raw_texts[i].strip(), para_text))
 
     # Only show the annex headers, not all the debug text
     for i, para_text, normalized in annex_paragraphs:
@@ -244,8 +246,7 @@ def find_annex_boundaries(doc: Document, target_annex: str, all_annex_headers: L
         print(f"🎯 {target_annex} boundary headers: {priority_headers}")
 
     # Main processing loop
-    for i, para in enumerate(doc.paragraphs):
-        para_text = normalize_text(para.text)
+    for i, (raw_text, para_text) in enumerate(zip(raw_texts, normalized_texts)):
 
         # Found target annex start - use strict matching (skip for Annex I since we start at 0)
         if not is_annex_i and start_idx is None and para_text.startswith(target_upper):
@@ -253,7 +254,7 @@ def find_annex_boundaries(doc: Document, target_annex: str, all_annex_headers: L
             # e.g., "ANNEX I" should not match "ANNEX III"
             if para_text == target_upper or para_text.startswith(target_upper + " "):
                 start_idx = i
-                logger.debug(f"📍 Found {target_annex} start at paragraph {i}: '{para.text[:50]}...'")
+                logger.debug(f"📍 Found {target_annex} start at paragraph {i}: '{raw_text[:50]}...'")
                 continue
 
         # Found next annex (end of current annex) - use mapping file headers with proper sequencing
@@ -267,19 +268,19 @@ def find_annex_boundaries(doc: Document, target_annex: str, all_annex_headers: L
                 # Simplified logging for performance - only log boundary matches
                 if "ANNEX" in para_text or "ANEXO" in para_text:
                     if para_text.startswith(header_upper):
-                        print(f"🔍 Para {i}: MATCH '{para.text.strip()}' vs '{header}'")
+                        print(f"🔍 Para {i}: MATCH '{raw_text.strip()}' vs '{header}'")
 
                 if para_text.startswith(header_upper):
                     # Make sure it's not the same annex continuing
                     # FIXED: Use exact match to avoid substring issues (e.g., "ANEXO II" vs "ANEXO I")
                     if para_text != target_upper and not para_text.startswith(target_upper + " "):
                         end_idx = i
-                        print(f"🔚 BOUNDARY FOUND! {target_annex} ends at paragraph {i}: '{para.text[:100]}...' (boundary: {header})")
+                        print(f"🔚 BOUNDARY FOUND! {target_annex} ends at paragraph {i}: '{raw_text[:100]}...' (boundary: {header})")
                         break
                     else:
-                        logger.debug(f"⚠️ Skipped same annex match: '{para.text[:50]}...'")
+                        logger.debug(f"⚠️ Skipped same annex match: '{raw_text[:50]}...'")
                 else:
-                    logger.debug(f"❌ No match for '{header}' in: '{para.text[:50]}...'")
+                    logger.debug(f"❌ No match for '{header}' in: '{raw_text[:50]}...'")
 
                 # Also log the exact text comparison for debugging
                 if i % 10 == 0:  # Log every 10th paragraph to avoid spam
@@ -292,7 +293,7 @@ def find_annex_boundaries(doc: Document, target_annex: str, all_annex_headers: L
 
     # If no end found, assume it goes to document end
     if start_idx is not None and end_idx is None:
-        end_idx = len(doc.paragraphs)
+        end_idx = len(raw_texts)
         logger.debug(f"📝 {target_annex} extends to document end (paragraph {end_idx})")
 
     return start_idx, end_idx
@@ -321,7 +322,9 @@ def prune_to_annex_with_boundaries(doc_path: str, target_annex: str, start_idx:
         start_time = time.time()
 
         doc = Document(doc_path)
-        print(f"   Loaded document with {len(doc.paragraphs)} paragraphs")
+        # doc.paragraphs builds a new list on every access, so take it once
+        paragraphs = doc.paragraphs
+        print(f"   Loaded document with {len(paragraphs)} paragraphs")
         print(f"   ⏱️ Document load time: {time.time() - start_time:.2f}s")
 
         if start_idx is None:
@@ -329,10 +332,7 @@ def prune_to_annex_with_boundaries(doc_path: str, target_annex: str, start_idx:
             return False
 
         # Build a set of paragraph elements that should be KEPT
-        keep_paragraph_elements = set()
-        for idx in range(start_idx, end_idx if end_idx is not None else len(doc.paragraphs)):
-            if idx < len(doc.paragraphs):
-                keep_paragraph_elements.add(doc.paragraphs[idx]._element)
+        keep_paragraph_elements = {para._element for para in paragraphs[start_idx:end_idx]}
 
         print(f"   🎯 Keeping {len(keep_paragraph_elements)} paragraph elements (para {start_idx} to {end_idx if end_idx else 'end'})")
 
@@ -418,7 +418,9 @@ def prune_to_annex(doc_path: str, target_annex: str, all_annex_headers: List[str
         print(f"✂️ PRUNING DOCUMENT to keep only {target_annex}")
         print(f"   Document path: {doc_path}")
         doc = Document(doc_path)
-        print(f"   Loaded document with {len(doc.paragraphs)} paragraphs")
+        # doc.paragraphs builds a new list on every access, so take it once
+        paragraphs = doc.paragraphs
+        print(f"   Loaded document with {len(paragraphs)} paragraphs")
 
         # Find annex boundaries
         start_idx, end_idx = find_annex_boundaries(doc, target_annex, all_annex_headers, is_annex_i, mapping_row)
@@ -430,15 +432,12 @@ def prune_to_annex(doc_path: str, target_annex: str, all_annex_headers: List[str
             return False
 
         logger.info(f"📍 Boundaries: start={start_idx}, end={end_idx}")
-        logger.debug(f"   Start paragraph: '{doc.paragraphs[start_idx].text[:100] if start_idx < len(doc.paragraphs) else 'N/A'}...'")
-        if end_idx and end_idx < len(doc.paragraphs):
-            logger.debug(f"   End paragraph: '{doc.paragraphs[end_idx].text[:100]}...'")
+        logger.debug(f"   Start paragraph: '{paragraphs[start_idx].text[:100] if start_idx < len(paragraphs) else 'N/A'}...'")
+        if end_idx and end_idx < len(paragraphs):
+            logger.debug(f"   End paragraph: '{paragraphs[end_idx].text[:100]}...'")
 
         # Build a set of paragraph elements that should be KEPT
-        keep_paragraph_elements = set()
-        for idx in range(start_idx, end_idx if end_idx is not None else len(doc.paragraphs)):
-            if idx < len(doc.paragraphs):
-                keep_paragraph_elements.add(doc.paragraphs[idx]._element)
+        keep_paragraph_elements = {para._element for para in paragraphs[start_idx:end_idx]}
 
         print(f"   🎯 Keeping {len(keep_paragraph_elements)} paragraph elements (para {start_idx} to {end_idx if end_idx else 'end'})")
 
@@ -871,13 +870,14 @@ def copy_headers_and_footers(source_doc: Document, dest_doc: Document) -> None:
                     dest_header = getattr(dest_section, dest_attr)
 
                     # Clear existing content
-                    for para in dest_header.paragraphs:
+                    dest_paragraphs = dest_header.paragraphs
+                    for para in dest_paragraphs:
                         para.clear()
 
                     # Copy paragraphs from source header
                     for i, source_para in enumerate(source_header.paragraphs):
-                        if i < len(dest_header.paragraphs):
-                            _copy_paragraph_content(dest_header.paragraphs[i], source_para)
+                        if i < len(dest_paragraphs):
+                            _copy_paragraph_content(dest_paragraphs[i], source_para)
                         else:
                             dest_header_para = dest_header.add_paragraph()
                             _copy_paragraph_content(dest_header_para, source_para)
@@ -899,13 +899,14 @@ def copy_headers_and_footers(source_doc: Document, dest_doc: Document) -> None:
                     dest_footer = getattr(dest_section, dest_attr)
 
                     # Clear existing content
-                    for para in dest_footer.paragraphs:
+                    dest_paragraphs = dest_footer.paragraphs
+                    for para in dest_paragraphs:
                         para.clear()
 
                     # Copy paragraphs from source footer
                     for i, source_para in enumerate(source_footer.paragraphs):
-                        if i < len(dest_footer.paragraphs):
-                            _copy_paragraph_content(dest_footer.paragraphs[i], source_para)
+                        if i < len(dest_paragraphs):
+                            _copy_paragraph_content(dest_paragraphs[i], source_para)
                         else:
                             dest_footer_para = dest_footer.add_paragraph()
                             _copy_paragraph_content(dest_footer_para, source_para)
@@ -202,8 +202,11 @@ class LocalRepTableProcessor:
 
         print(f"🔧 DEBUG: Processing row {row_index}")
 
+        # row.cells rebuilds the cell grid on every access; clearing text doesn't change it
+        cells = row.cells
+
         # 1. Identify cells to keep and clear the rest
-        for i, cell in enumerate(row.cells):
+        for i, cell in enumerate(cells):
             cell_text = cell.text.strip()
             should_keep = False
 
@@ -230,10 +233,12 @@ class LocalRepTableProcessor:
 
         # 3. Merge kept cells over cleared ones for clean formatting
         first_kept_cell_index = cells_to_keep_indices[0]
-        merge_target_cell = row.cells[first_kept_cell_index]
+        merge_target_cell = cells[first_kept_cell_index]
+        kept = set(cells_to_keep_indices)
 
-        for i, cell in enumerate(row.cells):
-            if i != first_kept_cell_index and cell.text == '':
+        # Every cell not kept was cleared in step 1, so no need to re-read its text
+        for i, cell in enumerate(cells):
+            if i not in kept:
                 try:
                     merge_target_cell.merge(cell)
                     print(f"🔗 DEBUG: Merged cell [{row_index},{i}] into [{row_index},{first_kept_cell_index}]")
@@ -317,17 +322,16 @@ class LocalRepTableProcessor:
             if all_cells_empty:
                 if first_empty_row_found:
                     # This is not the first empty row, mark for removal
-                    rows_to_remove.append(i)
+                    rows_to_remove.append((i, row._element))
                     print(f"🗑️  DEBUG: Marking empty row {i} for removal")
                 else:
                     # This is the first empty row, keep it for formatting
                     first_empty_row_found = True
                     print(f"✅ DEBUG: Keeping first empty row {i} for formatting")
 
-        # Remove rows in reverse order to maintain indices
-        for row_index in reversed(rows_to_remove):
+        # Remove the collected row elements directly (no table.rows re-indexing)
+        for row_index, row_element in reversed(rows_to_remove):
             try:
-                row_element = table.rows[row_index]._element
                 row_element.getparent().remove(row_element)
                 print(f"🔗 DEBUG: Removed empty row {row_index}")
             except Exception as e:
@@ -15,21 +15,29 @@ Complete implementation with all required functionality:
 """
 
 
+import io
 import os
 import re
 import shutil
 import logging
 import locale
 import calendar
-import asyncio
 import unicodedata
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import accumulate, islice
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, NamedTuple, Union
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, NamedTuple, Union
 from dataclasses import dataclass
 from datetime import datetime
+import numpy as np
 import pandas as pd
 import subprocess
 from copy import deepcopy
+from lxml import etree
 from docx import Document
 from docx.text.paragraph import Paragraph
 from docx.text.run import Run
@@ -59,7 +67,8 @@ from .date_formatter import (
 from .utils import (
     get_country_code_mapping, extract_country_code_from_filename,
     identify_document_country_and_language, find_mapping_rows_for_language,
-    generate_output_filename, load_mapping_table, is_header_match
+    group_mapping_rows_by_language,
+    generate_output_filename, load_mapping_table, load_mapping_table_cached, is_header_match
 )
 from .hyperlinks import (
     URLValidationResult, URLAccessibilityResult, URLValidationConfig,
@@ -67,6 +76,7 @@ from .hyperlinks import (
     create_hyperlink_run_enhanced, create_hyperlink_element,
     create_styled_text_fallback_element, validate_and_test_url_complete
 )
+from .local_rep_table_processor import LocalRepTableProcessor
 
 # Define utility functions that are processor-specific
 
@@ -101,6 +111,7 @@ class ThreadSafePDFConverter:
         self._initialized = True
         self._conversion_queue = queue.Queue()
         self._worker_thread = None
+        self._extra_workers = {}
         self._shutdown_event = threading.Event()
         self._start_worker()
 
@@ -116,8 +127,36 @@ class ThreadSafePDFConverter:
             )
             self._worker_thread.start()
 
-    def _worker_loop(self):
-        """Main loop for the PDF conversion worker thread."""
+    def ensure_workers(self, count: int) -> None:
+        """
+        Make sure at least `count` worker threads are consuming the queue.
+
+        LibreOffice instances sharing a user profile cannot run at the same
+        time, so each extra worker gets its own profile directory.
+        """
+        import tempfile
+        import threading
+
+        self._start_worker()
+        with self._lock:
+            for index in range(1, count):
+                worker = self._extra_workers.get(index)
+                if worker is not None and worker.is_alive():
+                    continue
+                profile_dir = os.path.join(
+                    tempfile.gettempdir(), f"regulatory_processor_lo_{os.getpid()}_{index}"
+                )
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    args=(profile_dir,),
+                    daemon=True,
+                    name=f"PDFConverter-{index}"
+                )
+                self._extra_workers[index] = worker
+                worker.start()
+
+    def _worker_loop(self, profile_dir: Optional[str] = None):
+        """Main loop for a PDF conversion worker thread."""
         import subprocess
         import os
         import time
@@ -130,11 +169,15 @@ class ThreadSafePDFConverter:
                 if task is None:  # Sentinel value for shutdown
                     break
 
-                doc_path, output_dir, result_queue = task
+                doc_paths, output_dir, result_queue = task
 
                 try:
-                    # Perform the actual LibreOffice conversion
-                    pdf_output_path = Path(output_dir) / Path(doc_path).with_suffix(".pdf").name
+                    # Perform the actual LibreOffice conversion; one invocation
+                    # converts every document of the task
+                    pdf_output_paths = [
+                        Path(output_dir) / Path(doc_path).with_suffix(".pdf").name
+                        for doc_path in doc_paths
+                    ]
 
                     # Find LibreOffice command
                     libreoffice_cmd = _find_libreoffice_command()
@@ -150,21 +193,25 @@ class ThreadSafePDFConverter:
                         'QT_QPA_PLATFORM': 'offscreen',  # Qt platform for headless
                     })
 
+                    command = [
+                        libreoffice_cmd, '--headless', '--convert-to', 'pdf',
+                        '--outdir', str(output_dir), *doc_paths
+                    ]
+                    if profile_dir:
+                        command.insert(1, f"-env:UserInstallation={Path(profile_dir).as_uri()}")
+
                     # Run LibreOffice conversion
                     result = subprocess.run(
-                        [
-                            libreoffice_cmd, '--headless', '--convert-to', 'pdf',
-                            '--outdir', str(output_dir), doc_path
-                        ],
-                        timeout=60,
+                        command,
+                        timeout=60 * len(doc_paths),
                         stdout=subprocess.DEVNULL,
                         stderr=subprocess.PIPE,
                         text=True,
                         env=env  # Pass explicit environment
                     )
 
-                    if result.returncode == 0 and pdf_output_path.exists():
-                        result_queue.put(("success", str(pdf_output_path)))
+                    if result.returncode == 0 and all(path.exists() for path in pdf_output_paths):
+                        result_queue.put(("success", [str(path) for path in pdf_output_paths]))
                     else:
                         error_msg = result.stderr if result.stderr else f"Return code: {result.returncode}"
                         result_queue.put(("error", f"LibreOffice failed: {error_msg}"))
@@ -192,8 +239,31 @@ class ThreadSafePDFConverter:
         Returns:
             tuple: (status, result) where status is 'success' or 'error'
         """
+        status, result = self.convert_batch([doc_path], output_dir, timeout)
+        if status == "success":
+            return status, result[0]
+        return status, result
+
+    def convert_batch(self, doc_paths: List[str], output_dir: str,
+                      timeout: Optional[float] = None) -> tuple[str, Union[List[str], str]]:
+        """
+        Convert several documents to PDF with a single LibreOffice invocation.
+
+        LibreOffice startup dominates the cost of a conversion, so converting
+        documents that share an output directory together pays it once.
+
+        Args:
+            doc_paths: Paths to the input documents
+            output_dir: Directory for the output PDFs
+            timeout: Maximum time to wait; defaults to 70 seconds per document
+
+        Returns:
+            tuple: ('success', list of PDF paths in input order) or ('error', message)
+        """
         import queue
-        import threading
+
+        if timeout is None:
+            timeout = 10.0 + 60.0 * len(doc_paths)
 
         # Ensure worker is running
         self._start_worker()
@@ -202,7 +272,7 @@ class ThreadSafePDFConverter:
         result_queue = queue.Queue()
 
         # Submit conversion task
-        self._conversion_queue.put((doc_path, output_dir, result_queue))
+        self._conversion_queue.put((list(doc_paths), output_dir, result_queue))
 
         # Wait for result with timeout
         try:
@@ -360,13 +430,14 @@ def copy_headers_and_footers(source_doc: Document, dest_doc: Document) -> None:
                     dest_header = getattr(dest_section, dest_attr)
 
                     # Clear existing content
-                    for para in dest_header.paragraphs:
+                    dest_paragraphs = dest_header.paragraphs
+                    for para in dest_paragraphs:
                         para.clear()
 
                     # Copy paragraphs from source header
                     for i, source_para in enumerate(source_header.paragraphs):
-                        if i < len(dest_header.paragraphs):
-                            _copy_paragraph_content(dest_header.paragraphs[i], source_para)
+                        if i < len(dest_paragraphs):
+                            _copy_paragraph_content(dest_paragraphs[i], source_para)
                         else:
                             dest_header_para = dest_header.add_paragraph()
                             _copy_paragraph_content(dest_header_para, source_para)
@@ -388,13 +459,14 @@ def copy_headers_and_footers(source_doc: Document, dest_doc: Document) -> None:
                     dest_footer = getattr(dest_section, dest_attr)
 
                     # Clear existing content
-                    for para in dest_footer.paragraphs:
+                    dest_paragraphs = dest_footer.paragraphs
+                    for para in dest_paragraphs:
                         para.clear()
 
                     # Copy paragraphs from source footer
                     for i, source_para in enumerate(source_footer.paragraphs):
-                        if i < len(dest_footer.paragraphs):
-                            _copy_paragraph_content(dest_footer.paragraphs[i], source_para)
+                        if i < len(dest_paragraphs):
+                            _copy_paragraph_content(dest_paragraphs[i], source_para)
                         else:
                             dest_footer_para = dest_footer.add_paragraph()
                             _copy_paragraph_content(dest_footer_para, source_para)
@@ -446,6 +518,237 @@ def copy_styles(source_doc: Document, dest_doc: Document) -> None:
 # CONSTANTS AND CONFIGURATION
 # =============================================================================
 
+logger = logging.getLogger(__name__)
+
+_NS = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
+
+# Precompiled XPaths for locating hyperlinks and the runs nested inside them
+_XP_HYPERLINK = etree.XPath('.//w:hyperlink', namespaces=_NS)
+_XP_R = etree.XPath('.//w:r', namespaces=_NS)
+
+# True when an element references a package part (images, hyperlinks, embeds),
+# which a plain XML copy cannot carry into another document
+_XP_HAS_REL_REF = etree.XPath(
+    'boolean(.//@r:*)',
+    namespaces={'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'}
+)
+
+# Text of the w:t elements that make up body paragraph text (direct runs and
+# runs inside hyperlinks, as Paragraph.text reads them), in document order
+_XP_BODY_RUN_TEXT = etree.XPath(
+    'w:p/w:r/w:t/text() | w:p/w:hyperlink/w:r/w:t/text()', namespaces=_NS
+)
+
+# Characters that may come from elements other than w:t in Paragraph.text
+# (breaks, tabs, no-break hyphens) or whose lowercase form depends on context
+# (final sigma); a pre-filter fragment must not contain them
+_PREFILTER_BREAK_RE = re.compile(r'[\t\n\-σς]+')
+
+# Clark-notation tag and attribute names used on hot paths
+_W_P = qn('w:p')
+_W_RPR = qn('w:rPr')
+_W_PPR = qn('w:pPr')
+_W_SHD = qn('w:shd')
+_W_FILL = qn('w:fill')
+_W_HYPERLINK = qn('w:hyperlink')
+
+# URL markers that make run text look like a link, searched in one pass
+_URL_MARKER_RE = re.compile(r'http://|https://|www\.|mailto:')
+
+# Characters python-docx writes as run elements rather than w:t text
+_RUN_SPECIAL_CHAR_RE = re.compile(r'([\t\n\r])')
+
+# Line number at the start of mapping column names such as "Line 3 - SmPC"
+_LINE_NUM_RE = re.compile(r'Line (\d+)')
+
+# Shared table processor for local representatives, created on first use
+_TABLE_PROCESSOR: Optional[LocalRepTableProcessor] = None
+
+# Multi-language phrases that introduce the Annex IIIB revision date (matched against lowercased text)
+_DATE_KW_RE = re.compile(r'leaflet was last revised|dernière approbation|última revisión')
+
+# Phrases that end the local representative block in PL Section 6 (matched against lowercased text)
+_SEC6_END_RE = re.compile(r'marketing authorisation holder|manufacturing authorisation holder|this leaflet was last revised')
+
+# Local representative entries start with a country name followed by a colon ("Germany:")
+_COUNTRY_REP_RE = re.compile(r'[A-Za-z\s]+:')
+
+# Numbered section headers such as "7." or "Section 7"
+_SECTION_RE = re.compile(r'\s*(?:\d+\.|section\s+\d+)', re.IGNORECASE)
+
+# Comprehensive annex header base words from mapping data
+_ANNEX_BASE_WORDS = [
+    'bijlage',      # Dutch
+    'annexe',       # French  
+    'anhang',       # German
+    'lisa',         # Estonian
+    'παραρτημα',    # Greek
+    'pielikums',    # Latvian
+    'priedas',      # Lithuanian
+    'anexo',        # Spanish/Portuguese
+    'prilog',       # Croatian
+    'priloga',      # Slovenian
+    'liite',        # Finnish
+    'bilaga',       # Swedish
+    'allegato',     # Italian
+    'annex',        # English
+    'anness',       # Maltese
+    'bilag',        # Danish
+    'viðauki',      # Icelandic
+    'vedlegg',      # Norwegian
+    'příloha',      # Czech
+    'aneks',        # Polish
+    'príloha',      # Slovak
+    'приложение',   # Bulgarian
+    'melléklet',    # Hungarian
+    'anexa',        # Romanian
+]
+_ANNEX_BASE_LOWER = [word.lower() for word in _ANNEX_BASE_WORDS]
+
+# One-pass prefilter: does a text contain any annex base word at all?
+_ANNEX_WORDS_RE = re.compile('|'.join(re.escape(word) for word in _ANNEX_BASE_LOWER), re.IGNORECASE)
+
+
+def _build_similar_header_patterns() -> List[re.Pattern]:
+    """Compile the word-first and number-first annex header patterns once."""
+    # Roman numeral patterns (including Greek variants)
+    roman_patterns = [
+        r'[ivx]+',          # Standard: i, ii, iii, iv, v
+        r'[ιυχ]+',          # Greek: ι, ιι, ιιι
+        r'\d+',             # Arabic numbers: 1, 2, 3 (backup)
+    ]
+    
+    patterns = []
+    for base_word in _ANNEX_BASE_WORDS:
+        for roman_pattern in roman_patterns:
+            # Pattern 1: Word first (e.g., "ANNEXE I", "BIJLAGE II")
+            patterns.append(rf'{re.escape(base_word)}\s*\.?\s*{roman_pattern}\.?')
+            
+            # Pattern 2: Number first (e.g., "I LISA", "II LISA") 
+            patterns.append(rf'{roman_pattern}\.?\s+{re.escape(base_word)}')
+            
+            # Pattern 3: Number with period first (e.g., "I. MELLÉKLET")
+            patterns.append(rf'{roman_pattern}\.\s*{re.escape(base_word)}')
+    
+    return [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+
+
+_SIMILAR_HEADER_PATTERNS = _build_similar_header_patterns()
+
+# Punctuation that varies between header spellings and is ignored when matching
+_PUNCT_CHARS = '.,;:!?"()'
+_PUNCT_TABLE = str.maketrans('', '', _PUNCT_CHARS)
+_PUNCT_BYTES = _PUNCT_CHARS.encode('ascii')
+
+# Shading fills treated as gray (lowercase hex or named values)
+_GRAY_HEX_ALL = frozenset([
+    'bfbfbf', 'cccccc', 'd9d9d9', '808080', '999999', '666666', 'c0c0c0', 'a0a0a0',
+    'b3b3b3', '606060', 'f5f5f5', 'e0e0e0',
+    'lightgray', 'gray', 'darkgray', 'auto'
+])
+_DEBUG_GRAY_FILLS = frozenset(['d9d9d9', 'cccccc', 'gray', 'lightgray', 'auto'])
+
+# Font colors treated as gray, packed as 24-bit 0xRRGGBB ints
+_GRAY_RGB_INT = frozenset([
+    0x808080, 0x999999, 0x666666, 0x606060, 0xD9D9D9, 0xBFBFBF
+])
+_GRAY_RGB_ALL_INT = _GRAY_RGB_INT | frozenset([
+    0xA0A0A0, 0xC0C0C0, 0xE0E0E0, 0xF5F5F5,
+    0xB3B3B3, 0x8C8C8C, 0x707070, 0x4B4B4B
+])
+_DEBUG_GRAY_RGB_INT = frozenset([0x808080, 0x999999, 0x666666, 0x606060, 0xD9D9D9])
+
+# Common hyperlink font colors, packed as 24-bit ints
+_HYPERLINK_RGB_INT = frozenset([
+    0x0000FF,  # Standard blue
+    0x0000EE,  # Slightly different blue
+    0x0563C1,  # Word default hyperlink blue
+    0x1155CC,  # Google Docs blue
+    0x4678B4,  # Alternative blue
+])
+
+
+def _pack(color: RGBColor) -> int:
+    """Pack an RGBColor into a single 0xRRGGBB int for fast set lookups."""
+    r, g, b = color
+    return (r << 16) | (g << 8) | b
+
+
+def _cell(row: Union[pd.Series, Dict], col: str, default: str = '') -> str:
+    """Return a mapping cell as stripped text, or ``default`` if missing/NaN."""
+    value = row.get(col)
+    if pd.isna(value):
+        return default
+    return str(value).strip()
+
+
+def _split_clean(text: str, delimiter: str):
+    """Yield the stripped, non-empty, non-'nan' parts of ``text`` split on ``delimiter``."""
+    for part in text.split(delimiter):
+        part = part.strip()
+        if part and part.lower() != 'nan':
+            yield part
+
+
+def _new_run(text: str, bold: Optional[bool] = None):
+    """
+    Build a detached ``w:r`` element holding ``text``.
+
+    Produces the same XML as ``para.add_run(text)`` (tabs become w:tab, line
+    breaks w:br) followed by ``run.bold = bold`` when ``bold`` is given,
+    without creating python-docx Run and font proxies.
+    """
+    r = OxmlElement('w:r')
+    if bold is not None:
+        r_pr = OxmlElement('w:rPr')
+        r_pr.append(OxmlElement('w:b') if bold else OxmlElement('w:b', {qn('w:val'): '0'}))
+        r.append(r_pr)
+    for piece in _RUN_SPECIAL_CHAR_RE.split(text):
+        if piece == '\t':
+            r.append(OxmlElement('w:tab'))
+        elif piece in ('\n', '\r'):
+            r.append(OxmlElement('w:br'))
+        elif piece:
+            t = OxmlElement('w:t')
+            t.text = piece
+            if len(piece.strip()) < len(piece):
+                t.set(qn('xml:space'), 'preserve')
+            r.append(t)
+    return r
+
+
+def _save_document(doc: Document, path: Union[str, Path]) -> None:
+    """
+    Save a document with a single write to disk.
+
+    The zip writer seeks back to patch each member's header; doing that in
+    memory avoids many small writes and seeks on slow or network drives.
+    """
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    with open(path, 'wb') as f:
+        f.write(buffer.getbuffer())
+
+
+def _iter_paragraphs(doc: Document):
+    """Yield the body paragraphs of ``doc`` lazily, in ``doc.paragraphs`` order."""
+    body = doc._body
+    for p in doc.element.body.iterchildren(_W_P):
+        yield Paragraph(p, body)
+
+
+def _body_may_contain(doc: Document, target_lower: str) -> bool:
+    """Return False only if no body paragraph's lowercased text can contain ``target_lower``.
+
+    Joins the body's run text in a single XPath call and looks for the longest
+    piece of the target that Paragraph.text could only have taken from w:t
+    elements, so paragraphs need not be wrapped and walked one by one when the
+    target is absent from the document.
+    """
+    fragment = max(_PREFILTER_BREAK_RE.split(target_lower), key=len)
+    if not fragment:
+        return True
+    return fragment in ''.join(_XP_BODY_RUN_TEXT(doc.element.body)).lower()
 
 
 
@@ -483,23 +786,23 @@ def is_hex_gray_color(hex_color: str) -> bool:
 def is_run_gray_shaded(run: Run) -> bool:
     """Check if a run has gray shading."""
     try:
-        run_pr = run._element.get_or_add_rPr()
-        shading_elements = run_pr.findall('.//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}shd')
-        
-        if shading_elements:
-            for shading in shading_elements:
-                fill = shading.get(qn('w:fill'))
-                if fill and is_hex_gray_color(fill):
-                    return True
+        # Read-only lookup: don't insert an empty <w:rPr/> into unstyled runs.
+        # Shading and font color both live in rPr, so a run without one is plain.
+        run_pr = run._element.find(_W_RPR)
+        if run_pr is None:
+            return False
+
+        # w:shd is a direct child of rPr; a descendant search would also see
+        # the superseded shading kept under a tracked w:rPrChange
+        for shading in run_pr.iterchildren(_W_SHD):
+            fill = shading.get(_W_FILL)
+            if fill and is_hex_gray_color(fill):
+                return True
         
         # Check font color for gray
         if run.font.color and hasattr(run.font.color, 'rgb'):
-            gray_colors = [
-                RGBColor(128, 128, 128), RGBColor(153, 153, 153), 
-                RGBColor(102, 102, 102), RGBColor(96, 96, 96),
-                RGBColor(217, 217, 217), RGBColor(191, 191, 191)
-            ]
-            if run.font.color.rgb in gray_colors:
+            color = run.font.color.rgb
+            if color is not None and _pack(color) in _GRAY_RGB_INT:
                 return True
                 
     except Exception:
@@ -511,49 +814,25 @@ def is_run_gray_shaded(run: Run) -> bool:
 def is_run_gray_shaded_enhanced(run: Run) -> bool:
     """Enhanced gray shading detection with comprehensive color matching."""
     try:
-        # First use the original method
-        if is_run_gray_shaded(run):
-            return True
-
-        # Check run properties for shading with more extensive color list
-        run_pr = run._element.get_or_add_rPr()
-        shading_elements = run_pr.findall('.//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}shd')
-
-        if shading_elements:
-            for shading in shading_elements:
-                fill = shading.get(qn('w:fill'))
-                if fill:
-                    # Extended gray color list in hex format
-                    gray_hex_colors = [
-                        'd9d9d9', 'cccccc', 'c0c0c0', 'bfbfbf', 'b3b3b3', 'a0a0a0',
-                        '999999', '808080', '666666', '606060', 'f5f5f5', 'e0e0e0',
-                        'lightgray', 'gray', 'darkgray', 'auto'
-                    ]
-                    if fill.lower() in gray_hex_colors:
-                        return True
+        # Check run properties for shading against the full gray color set
+        run_pr = run._element.find(_W_RPR)
+        if run_pr is not None:
+            for shading in run_pr.iterchildren(_W_SHD):
+                fill = shading.get(_W_FILL)
+                if fill and (fill.lower() in _GRAY_HEX_ALL or is_hex_gray_color(fill)):
+                    return True
 
         # Enhanced font color checking with more gray variations
         if run.font.color and hasattr(run.font.color, 'rgb') and run.font.color.rgb is not None:
             color = run.font.color.rgb
-            # Expanded gray color list
-            gray_colors = [
-                # Original grays
-                RGBColor(128, 128, 128), RGBColor(153, 153, 153),
-                RGBColor(102, 102, 102), RGBColor(96, 96, 96),
-                RGBColor(217, 217, 217), RGBColor(191, 191, 191),
-                # Additional gray variations
-                RGBColor(160, 160, 160), RGBColor(192, 192, 192),
-                RGBColor(224, 224, 224), RGBColor(245, 245, 245),
-                RGBColor(179, 179, 179), RGBColor(140, 140, 140),
-                RGBColor(112, 112, 112), RGBColor(75, 75, 75)
-            ]
 
             # Check for exact matches
-            if color in gray_colors:
+            if _pack(color) in _GRAY_RGB_ALL_INT:
                 return True
 
             # Check if color components are approximately equal (indicating gray)
-            if abs(color.r - color.g) < 20 and abs(color.g - color.b) < 20 and abs(color.r - color.b) < 20:
+            r, g, b = color
+            if abs(r - g) < 20 and abs(g - b) < 20 and abs(r - b) < 20:
                 # It's some shade of gray
                 return True
 
@@ -563,6 +842,21 @@ def is_run_gray_shaded_enhanced(run: Run) -> bool:
     return False
 
 
+def is_gray_batch(rgb_array) -> np.ndarray:
+    """
+    Vectorized near-gray check for many colors at once.
+
+    Applies the same rule as is_run_gray_shaded_enhanced (all channels within
+    20 of each other) to an (N, 3) array of RGB values. Single runs should keep
+    using the scalar detector.
+
+    Returns:
+        np.ndarray: Boolean mask with one entry per color
+    """
+    rgb = np.asarray(rgb_array, dtype=np.int16).reshape(-1, 3)
+    return (rgb.max(axis=1) - rgb.min(axis=1)) < 20
+
+
 def is_run_hyperlink(run: Run) -> bool:
     """Check if a run is part of a hyperlink."""
     try:
@@ -612,21 +906,13 @@ def is_run_hyperlink_enhanced(run: Run) -> bool:
         if run.font.color and hasattr(run.font.color, 'rgb') and run.font.color.rgb is not None:
             color = run.font.color.rgb
 
-            # Common hyperlink colors
-            hyperlink_colors = [
-                RGBColor(0, 0, 255),    # Standard blue
-                RGBColor(0, 0, 238),    # Slightly different blue
-                RGBColor(5, 99, 193),   # Word default hyperlink blue
-                RGBColor(17, 85, 204),  # Google Docs blue
-                RGBColor(70, 120, 180), # Alternative blue
-            ]
-
             # Check for hyperlink colors with or without underline
-            if color in hyperlink_colors:
+            if _pack(color) in _HYPERLINK_RGB_INT:
                 return True
 
             # Check for blue-ish colors that might be hyperlinks
-            if color.r < 100 and color.g < 150 and color.b > 150:
+            r, g, b = color
+            if r < 100 and g < 150 and b > 150:
                 return True
 
         # Check if run has underline (common for hyperlinks)
@@ -635,7 +921,7 @@ def is_run_hyperlink_enhanced(run: Run) -> bool:
 
         # Check if text looks like a URL
         text = run.text.strip().lower()
-        if any(url_start in text for url_start in ['http://', 'https://', 'www.', 'mailto:']):
+        if _URL_MARKER_RE.search(text):
             return True
 
     except Exception as e:
@@ -762,72 +1048,70 @@ def find_runs_to_remove(para: Paragraph, target_string: str) -> List[Run]:
     if not target_string.strip():
         return []
 
-    print(f"\n🎯 ENHANCED TEXT REMOVAL")
-    print(f"Target: '{target_string}'")
-    print(f"Paragraph text: '{para.text}'")
+    logger.debug("🎯 ENHANCED TEXT REMOVAL - target: %r", target_string)
+
+    # Materialize runs and their text once; each run.text walks the XML
+    runs = list(para.runs)
+    texts = [run.text for run in runs]
 
     # Check if we have a runs vs text mismatch (indicates invisible hyperlinks)
     para_text_len = len(para.text)
-    runs_text_len = sum(len(run.text) for run in para.runs)
+    runs_text_len = sum(map(len, texts))
     has_invisible_content = para_text_len != runs_text_len
 
     if has_invisible_content:
-        print(f"🔍 Detected invisible content (text: {para_text_len}, runs: {runs_text_len} chars)")
-        print(f"🎯 Using XML-based removal for hyperlink handling...")
+        logger.debug("🔍 Detected invisible content (text: %d, runs: %d chars), using XML-based removal",
+                     para_text_len, runs_text_len)
 
         # Use XML-based removal for invisible content
         success = _remove_target_text_xml_internal(para, target_string)
         if success:
-            print(f"✅ XML-based removal completed")
+            logger.debug("✅ XML-based removal completed")
             return []  # Return empty list since removal was done directly
-        else:
-            print(f"⚠️  XML removal failed, falling back to run-based approach")
+        logger.debug("⚠️ XML removal failed, falling back to run-based approach")
+        # The failed attempt may still have edited the paragraph
+        runs = list(para.runs)
+        texts = [run.text for run in runs]
 
     # Original run-based approach (fallback or primary for simple cases)
-    print(f"🎯 Using run-based removal...")
     runs_to_remove = []
 
     # Find target text range
     target_start, target_end = find_target_text_range(para, target_string)
 
     if target_start == -1:
-        print(f"❌ Target text not found")
+        logger.debug("❌ Target text not found")
         return runs_to_remove
 
-    print(f"✅ Target found at position {target_start}-{target_end}")
+    logger.debug("✅ Target found at position %d-%d", target_start, target_end)
 
-    # Map character positions to runs
-    char_pos = 0
-    run_ranges = []
-
-    for run in para.runs:
-        run_start = char_pos
-        run_end = char_pos + len(run.text)
-        run_ranges.append((run, run_start, run_end))
-        char_pos = run_end
+    # Map character positions to runs. Offsets only grow, so the runs that
+    # overlap the target form one contiguous slice found by binary search.
+    run_ends = list(accumulate(map(len, texts)))
+    run_starts = [run_end - len(text) for run_end, text in zip(run_ends, texts)]
+    first = bisect_right(run_ends, target_start)
+    last = bisect_left(run_starts, target_end)
 
     # Find runs that overlap with target text and are styled
-    for i, (run, run_start, run_end) in enumerate(run_ranges):
-        if run_start < target_end and run_end > target_start:
-            is_gray = is_run_gray_shaded(run)
-            is_hyperlink = is_run_hyperlink(run)
-
-            if is_gray or is_hyperlink or run.text.strip() in target_string:
-                runs_to_remove.append(run)
-                reasons = []
-                if is_gray: reasons.append("gray shaded")
-                if is_hyperlink: reasons.append("hyperlink")
-                if run.text.strip() in target_string: reasons.append("contains target text")
-                print(f"  ✅ REMOVING Run {i}: '{run.text}' - {', '.join(reasons)}")
-            else:
-                print(f"  ⏭️  KEEPING Run {i}: '{run.text}' - not styled")
-        else:
-            print(f"  ⏭️  KEEPING Run {i}: '{run.text}' - outside target range")
+    for i in range(first, last):
+        run, text = runs[i], texts[i]
+        is_gray = is_run_gray_shaded(run)
+        is_hyperlink = is_run_hyperlink(run)
 
-    print(f"🗑️  Will remove {len(runs_to_remove)} runs out of {len(run_ranges)} total")
+        if is_gray or is_hyperlink or text.strip() in target_string:
+            runs_to_remove.append(run)
+            logger.debug("  ✅ REMOVING Run %d: %r (gray=%s, hyperlink=%s)", i, text, is_gray, is_hyperlink)
+
+    logger.debug("🗑️ Will remove %d runs out of %d total", len(runs_to_remove), len(runs))
     return runs_to_remove
 
 
+def _is_doubled(text: str) -> bool:
+    """Check if text consists of the same half repeated twice (corrupted docs)."""
+    n = len(text)
+    return n >= 2 and n % 2 == 0 and text[:n // 2] == text[n // 2:]
+
+
 def _remove_target_text_xml_internal(paragraph: Paragraph, target_string: str) -> bool:
     """
     Internal XML-based text removal for invisible hyperlinks.
@@ -847,9 +1131,9 @@ def _remove_target_text_xml_internal(paragraph: Paragraph, target_string: str) -
             full_text = "".join(t.text or '' for t in text_elements)
 
         # Handle text duplication (corrupted docs)
-        if len(full_text) > 0 and full_text == (full_text[:len(full_text)//2] * 2):
+        if _is_doubled(full_text):
             full_text = full_text[:len(full_text)//2]
-            print(f"📝 Cleaned duplicated text")
+            logger.debug("📝 Cleaned duplicated text")
 
         # Find target position
         target_start = full_text.lower().find(target_string.lower())
@@ -864,7 +1148,7 @@ def _remove_target_text_xml_internal(paragraph: Paragraph, target_string: str) -
         except:
             all_runs = p_element.findall(f'.//{{{w_namespace}}}r')
 
-        print(f"🔍 Processing {len(all_runs)} XML runs...")
+        logger.debug("🔍 Processing %d XML runs...", len(all_runs))
 
         # Process runs and mark for deletion/modification
         current_pos = 0
@@ -878,7 +1162,7 @@ def _remove_target_text_xml_internal(paragraph: Paragraph, target_string: str) -
                 text_elements = run_element.findall(f'{{{w_namespace}}}t')
 
             run_text = "".join(t.text or '' for t in text_elements)
-            if len(run_text) > 0 and run_text == (run_text[:len(run_text)//2] * 2):
+            if _is_doubled(run_text):
                 run_text = run_text[:len(run_text)//2]
 
             run_start = current_pos
@@ -893,19 +1177,17 @@ def _remove_target_text_xml_internal(paragraph: Paragraph, target_string: str) -
 
             current_pos = run_end
 
+        # Map each run nested in a hyperlink to that hyperlink in one pass
+        hyperlink_runs = {r: hp for hp in _XP_HYPERLINK(p_element) for r in _XP_R(hp)}
+
         # Execute deletions
         for run_element in runs_to_delete:
-            # Check if run is inside a hyperlink
-            hyperlink_parent = run_element.getparent()
-            while hyperlink_parent is not None:
-                if hyperlink_parent.tag.endswith('hyperlink'):
-                    hyperlink_parent.getparent().remove(hyperlink_parent)
-                    break
-                hyperlink_parent = hyperlink_parent.getparent()
-            else:
-                parent = run_element.getparent()
-                if parent is not None:
-                    parent.remove(run_element)
+            # Runs inside a hyperlink take the whole hyperlink with them
+            hyperlink_parent = hyperlink_runs.get(run_element)
+            target = hyperlink_parent if hyperlink_parent is not None else run_element
+            parent = target.getparent()
+            if parent is not None:
+                parent.remove(target)
 
         # Execute modifications
         for run_element, text_elements in runs_to_modify:
@@ -915,7 +1197,7 @@ def _remove_target_text_xml_internal(paragraph: Paragraph, target_string: str) -
         return True
 
     except Exception as e:
-        print(f"❌ XML removal error: {e}")
+        logger.warning("❌ XML removal error: %s", e)
         return False
 
 
@@ -925,15 +1207,16 @@ def find_gray_and_hyperlink_runs(para: Paragraph, target_string: str) -> List[Ru
     """
     runs_to_remove = []
     
-    # First find runs containing target text
-    target_runs = find_target_text_runs(para, target_string)
+    # First find runs containing target text. para.runs builds fresh Run
+    # proxies on every access, so key on the underlying w:r elements.
+    target_run_elements = {run._r for run in find_target_text_runs(para, target_string)}
     
     # Then find additional gray/hyperlink runs in vicinity
     for run in para.runs:
         should_remove = False
         
         # Remove if it's a target run
-        if run in target_runs:
+        if run._r in target_run_elements:
             should_remove = True
         # Remove if it's gray shaded
         elif is_run_gray_shaded(run):
@@ -1002,9 +1285,27 @@ def build_replacement_text_by_country(components: List[Dict]) -> str:
     # Join country blocks with double line breaks
     return '\n\n'.join(country_blocks)
 
+@lru_cache(maxsize=64)
+def _indexed_line_columns(columns: Tuple[str, ...], section_type: str) -> Tuple[Tuple[int, str], ...]:
+    """
+    Return a section's 'Line N' columns as (N, column) pairs sorted by N.
+
+    Every row of a mapping table has the same columns, so the scan and the
+    line-number parsing run once per table and section rather than per row.
+    Columns without a number sort last, keeping their table order.
+    """
+    indexed_columns = []
+    for col in columns:
+        if col.startswith('Line ') and section_type in col:
+            match = _LINE_NUM_RE.match(col)
+            indexed_columns.append((int(match.group(1)) if match else 999, col))
+    indexed_columns.sort(key=lambda pair: pair[0])
+    return tuple(indexed_columns)
+
+
 def get_replacement_components(mapping_row: pd.Series, section_type: str,
                               cached_components: Optional[List] = None,
-                              country_delimiter: str = ";") -> List:
+                              country_delimiter: str = ";") -> Sequence[Mapping]:
     """Build replacement text components from mapping data.
 
     Now supports multi-country block separation by grouping components by country.
@@ -1013,73 +1314,62 @@ def get_replacement_components(mapping_row: pd.Series, section_type: str,
     if cached_components is not None:
         return cached_components
 
+    # Plain dict lookups are much cheaper than repeated Series.get calls
+    row = mapping_row.to_dict() if isinstance(mapping_row, pd.Series) else mapping_row
+
+    # Get line columns for this section type, sorted by line number
+    indexed_columns = _indexed_line_columns(tuple(row), section_type)
+
+    if not indexed_columns:
+        return ()
+
+    # Every document processed for a language reuses the same mapping row, so
+    # the parsed components are memoized on the cleaned cell text. Callers
+    # share the cached tuple; its components are read-only mappings.
+    line_cells = tuple((line_num, _cell(row, col)) for line_num, col in indexed_columns)
+    return _build_replacement_components(
+        section_type, country_delimiter, line_cells,
+        _cell(row, f'Hyperlinks {section_type}'),
+        _cell(row, f'Link for email - {section_type}'),
+        _cell(row, f'Line 1 - Country names to be bolded - {section_type}'),
+    )
+
+
+@lru_cache(maxsize=256)
+def _build_replacement_components(section_type: str, country_delimiter: str,
+                                  line_cells: Tuple[Tuple[int, str], ...],
+                                  hyperlinks_str: str, email_str: str,
+                                  bold_countries_str: str) -> Tuple[Mapping, ...]:
+    """Parse a section's line, link and country cells into replacement components."""
     components = []
 
-    # Get line columns for this section type
-    line_columns = [col for col in mapping_row.index
-                   if col.startswith('Line ') and section_type in col]
-
-    if not line_columns:
-        return components
-
-    # Get hyperlinks and email links
-    hyperlinks_col = f'Hyperlinks {section_type}'
-    email_col = f'Link for email - {section_type}'
-
-    hyperlinks_str = str(mapping_row.get(hyperlinks_col, '')).strip()
-    email_str = str(mapping_row.get(email_col, '')).strip()
-
     # Parse hyperlinks and emails (semicolon separated)
-    hyperlinks = [h.strip() for h in hyperlinks_str.split(country_delimiter)
-                 if h.strip() and h.strip().lower() != 'nan']
-    emails = [e.strip() for e in email_str.split(country_delimiter)
-             if e.strip() and e.strip().lower() != 'nan']
-
-    # Sort line columns by number
-    def extract_line_number(col_name):
-        match = re.search(r'Line (\d+)', col_name)
-        return int(match.group(1)) if match else 999
-
-    sorted_columns = sorted(line_columns, key=extract_line_number)
+    hyperlinks = list(_split_clean(hyperlinks_str, country_delimiter))
+    emails = list(_split_clean(email_str, country_delimiter))
 
     # Find Line 1 to get countries
-    line_1_col = None
-    for col in sorted_columns:
-        if extract_line_number(col) == 1:
-            line_1_col = col
-            break
-
-    if not line_1_col:
-        return components
-
-    line_1_text = str(mapping_row.get(line_1_col, '')).strip()
-    if not line_1_text or line_1_text.lower() == 'nan':
-        return components
+    line_1_text = next((content for line_num, content in line_cells if line_num == 1), None)
 
-    # Get countries from dedicated bold country column
-    bold_countries_col = f'Line 1 - Country names to be bolded - {section_type}'
-    bold_countries_str = str(mapping_row.get(bold_countries_col, '')).strip()
+    if not line_1_text:
+        return ()
 
     # Parse countries using comma/semicolon delimiter
-    if bold_countries_str and bold_countries_str.lower() != 'nan':
+    if bold_countries_str:
         # Try comma first (as seen in mapping file), then semicolon as fallback
         if ',' in bold_countries_str:
-            countries = [c.strip() for c in bold_countries_str.split(',') if c.strip()]
+            countries = list(_split_clean(bold_countries_str, ','))
         else:
-            countries = [c.strip() for c in bold_countries_str.split(country_delimiter) if c.strip()]
+            countries = list(_split_clean(bold_countries_str, country_delimiter))
     else:
         # Fallback: extract from line text (backwards compatibility)
-        countries = [c.strip() for c in line_1_text.split(country_delimiter) if c.strip()]
+        countries = list(_split_clean(line_1_text, country_delimiter))
 
     if not countries:
-        return components
+        return ()
 
     # Process each line
-    for col in sorted_columns:
-        line_num = extract_line_number(col)
-        content = str(mapping_row.get(col, '')).strip()
-
-        if not content or content.lower() == 'nan':
+    for line_num, content in line_cells:
+        if not content:
             continue
 
         # Split content by countries using semicolon delimiter
@@ -1093,16 +1383,16 @@ def get_replacement_components(mapping_row: pd.Series, section_type: str,
                 hyperlink = hyperlinks[i] if i < len(hyperlinks) else None
                 email = emails[i] if i < len(emails) else None
 
-                components.append({
+                components.append(MappingProxyType({
                     'line': line_num,
                     'country': country,
                     'country_index': i,  # NEW: Add country index for grouping
                     'text': text,
                     'hyperlink': hyperlink,
                     'email': email
-                })
+                }))
 
-    return components
+    return tuple(components)
 
 
 def insert_formatted_replacement_surgically(para: Paragraph, insertion_point: int, 
@@ -1113,28 +1403,30 @@ def insert_formatted_replacement_surgically(para: Paragraph, insertion_point: in
     
     NEW: Only hyperlinks the specific text that matches the hyperlink/email value.
     """
-    # Group components by country first, then by line within each country
-    countries = {}
+    # Group components by country first, then by line within each country.
+    # The country name is already the first element of the key.
+    countries = defaultdict(lambda: defaultdict(list))
     for comp in components:
         country_key = (comp['country'], comp.get('country_index', 0))
-        line_num = comp['line']
-
-        if country_key not in countries:
-            countries[country_key] = {'country': comp['country'], 'lines': {}}
-
-        if line_num not in countries[country_key]['lines']:
-            countries[country_key]['lines'][line_num] = []
-        countries[country_key]['lines'][line_num].append(comp)
+        countries[country_key][comp['line']].append(comp)
 
     sorted_country_keys = sorted(countries.keys(), key=lambda x: x[1])
 
+    # Break-run templates, deep-copied for each insertion
+    single_br_template = OxmlElement('w:r')
+    single_br_template.append(OxmlElement('w:br'))
+    double_br_template = OxmlElement('w:r')
+    double_br_template.append(OxmlElement('w:br'))
+    double_br_template.append(OxmlElement('w:br'))
+
+    # para.runs wraps every run in the paragraph; build it once
     current_element = None
-    if insertion_point < len(para.runs):
-        current_element = para.runs[insertion_point]._element
+    runs = para.runs
+    if insertion_point < len(runs):
+        current_element = runs[insertion_point]._element
 
     # Add a single line break BEFORE the first country block
-    first_break_run_xml = OxmlElement('w:r')
-    first_break_run_xml.append(OxmlElement('w:br'))
+    first_break_run_xml = deepcopy(single_br_template)
     
     if current_element is not None:
         current_element.addnext(first_break_run_xml)
@@ -1145,13 +1437,10 @@ def insert_formatted_replacement_surgically(para: Paragraph, insertion_point: in
 
     # Build replacement text country by country
     for country_idx, country_key in enumerate(sorted_country_keys):
-        country_info = countries[country_key]
-        lines = country_info['lines']
+        lines = countries[country_key]
 
         if country_idx > 0:
-            double_break_run_xml = OxmlElement('w:r')
-            double_break_run_xml.append(OxmlElement('w:br'))
-            double_break_run_xml.append(OxmlElement('w:br'))
+            double_break_run_xml = deepcopy(double_br_template)
             current_element.addnext(double_break_run_xml)
             current_element = double_break_run_xml
 
@@ -1160,8 +1449,7 @@ def insert_formatted_replacement_surgically(para: Paragraph, insertion_point: in
             line_components = lines[line_num]
 
             if line_idx > 0:
-                line_break_run_xml = OxmlElement('w:r')
-                line_break_run_xml.append(OxmlElement('w:br'))
+                line_break_run_xml = deepcopy(single_br_template)
                 current_element.addnext(line_break_run_xml)
                 current_element = line_break_run_xml
 
@@ -1180,40 +1468,40 @@ def insert_formatted_replacement_surgically(para: Paragraph, insertion_point: in
 
                 # --- 1. RENDER AS EMAIL LINK (SPLIT) ---
                 if is_email_link:
-                    parts = re.split(f'({re.escape(email)})', text, 1)
+                    before, _, after = text.partition(email)
                     email_url = f'mailto:{email}' if not email.startswith('mailto:') else email
 
-                    if parts[0]:
-                        text_run = para.add_run(parts[0])
-                        current_element.addnext(text_run._element)
-                        current_element = text_run._element
+                    if before:
+                        run_element = _new_run(before)
+                        current_element.addnext(run_element)
+                        current_element = run_element
                     
                     link_element = create_hyperlink_element(para, email, email_url, document)
                     current_element.addnext(link_element)
                     current_element = link_element
 
-                    if len(parts) > 2 and parts[2]:
-                        text_run = para.add_run(parts[2])
-                        current_element.addnext(text_run._element)
-                        current_element = text_run._element
+                    if after:
+                        run_element = _new_run(after)
+                        current_element.addnext(run_element)
+                        current_element = run_element
 
                 # --- 2. RENDER AS HYPERLINK (SPLIT) ---
                 elif is_hyperlink:
-                    parts = re.split(f'({re.escape(hyperlink)})', text, 1)
+                    before, _, after = text.partition(hyperlink)
                     
-                    if parts[0]:
-                        text_run = para.add_run(parts[0])
-                        current_element.addnext(text_run._element)
-                        current_element = text_run._element
+                    if before:
+                        run_element = _new_run(before)
+                        current_element.addnext(run_element)
+                        current_element = run_element
                     
                     link_element = create_hyperlink_element(para, hyperlink, hyperlink, document)
                     current_element.addnext(link_element)
                     current_element = link_element
 
-                    if len(parts) > 2 and parts[2]:
-                        text_run = para.add_run(parts[2])
-                        current_element.addnext(text_run._element)
-                        current_element = text_run._element
+                    if after:
+                        run_element = _new_run(after)
+                        current_element.addnext(run_element)
+                        current_element = run_element
 
                 # --- 3. RENDER AS PLAIN TEXT (with potential bolding) ---
                 else:
@@ -1221,23 +1509,22 @@ def insert_formatted_replacement_surgically(para: Paragraph, insertion_point: in
                         parts = text.split(country, 1)
                         
                         if parts[0]:
-                            text_run = para.add_run(parts[0])
-                            current_element.addnext(text_run._element)
-                            current_element = text_run._element
+                            run_element = _new_run(parts[0])
+                            current_element.addnext(run_element)
+                            current_element = run_element
                         
-                        country_run = para.add_run(country)
-                        country_run.bold = True
-                        current_element.addnext(country_run._element)
-                        current_element = country_run._element
+                        country_element = _new_run(country, bold=True)
+                        current_element.addnext(country_element)
+                        current_element = country_element
                         
                         if len(parts) > 1 and parts[1]:
-                            remaining_run = para.add_run(parts[1])
-                            current_element.addnext(remaining_run._element)
-                            current_element = remaining_run._element
+                            run_element = _new_run(parts[1])
+                            current_element.addnext(run_element)
+                            current_element = run_element
                     else:
-                        text_run = para.add_run(text)
-                        current_element.addnext(text_run._element)
-                        current_element = text_run._element
+                        run_element = _new_run(text)
+                        current_element.addnext(run_element)
+                        current_element = run_element
                 
                 # ==========================================================
                 # END: MODIFIED LOGIC
@@ -1248,26 +1535,21 @@ def debug_paragraph_structure(para: Paragraph, target_string: str):
     """
     Debug function to understand paragraph structure and identify issues.
     """
-    print(f"\n🔍 DEBUGGING PARAGRAPH STRUCTURE")
-    print(f"Full paragraph text: '{para.text}'")
-    print(f"Target string: '{target_string}'")
-    print(f"Target found: {target_string.lower() in para.text.lower()}")
-    print(f"Number of runs: {len(para.runs)}")
-    
+    logger.debug("🔍 DEBUGGING PARAGRAPH STRUCTURE")
+    logger.debug("Full paragraph text: %r", para.text)
+    logger.debug("Target string: %r", target_string)
+    logger.debug("Target found: %s", target_string.lower() in para.text.lower())
+    logger.debug("Number of runs: %d", len(para.runs))
+
     for i, run in enumerate(para.runs):
-        print(f"\nRun {i}:")
-        print(f"  Text: '{run.text}'")
-        print(f"  Bold: {run.bold}")
-        print(f"  Underline: {run.underline}")
-        print(f"  Font color: {run.font.color.rgb if run.font.color else 'None'}")
-        
         # Check for shading
         is_shaded = is_run_gray_shaded_debug(run)
         is_hyperlink = is_run_hyperlink_debug(run)
-        
-        print(f"  Is gray shaded: {is_shaded}")
-        print(f"  Is hyperlink: {is_hyperlink}")
-        print(f"  Should remove: {is_shaded or is_hyperlink}")
+
+        logger.debug("Run %d: text=%r bold=%s underline=%s color=%s gray=%s hyperlink=%s remove=%s",
+                     i, run.text, run.bold, run.underline,
+                     run.font.color.rgb if run.font.color else None,
+                     is_shaded, is_hyperlink, is_shaded or is_hyperlink)
 
 
 def is_run_gray_shaded_debug(run: Run) -> bool:
@@ -1276,33 +1558,24 @@ def is_run_gray_shaded_debug(run: Run) -> bool:
     """
     try:
         # Check run properties for shading
-        run_pr = run._element.get_or_add_rPr()
-        shading_elements = run_pr.findall('.//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}shd')
+        run_pr = run._element.find(_W_RPR)
+        shading = run_pr.find(_W_SHD) if run_pr is not None else None
         
-        if shading_elements:
-            print(f"    Found shading elements: {len(shading_elements)}")
-            for shading in shading_elements:
-                fill = shading.get(qn('w:fill'))
-                print(f"    Shading fill: {fill}")
-                if fill and fill.lower() in ['d9d9d9', 'cccccc', 'gray', 'lightgray', 'auto']:
-                    return True
+        if shading is not None:
+            fill = shading.get(_W_FILL)
+            logger.debug("    Shading fill: %s", fill)
+            if fill and fill.lower() in _DEBUG_GRAY_FILLS:
+                return True
         
         # Check font color for gray
         if run.font.color and hasattr(run.font.color, 'rgb'):
             color = run.font.color.rgb
-            print(f"    Font color RGB: {color}")
-            gray_colors = [
-                RGBColor(128, 128, 128),  # Standard gray
-                RGBColor(153, 153, 153),  # Light gray
-                RGBColor(102, 102, 102),  # Dark gray
-                RGBColor(96, 96, 96),     # Another common gray
-                RGBColor(217, 217, 217),  # Very light gray
-            ]
-            if color in gray_colors:
+            logger.debug("    Font color RGB: %s", color)
+            if color is not None and _pack(color) in _DEBUG_GRAY_RGB_INT:
                 return True
                 
     except Exception as e:
-        print(f"    Error checking shading: {e}")
+        logger.debug("    Error checking shading: %s", e)
     
     return False
 
@@ -1313,21 +1586,19 @@ def is_run_hyperlink_debug(run: Run) -> bool:
     """
     try:
         # Check if run is within a hyperlink element
-        run_xml = run._r
-        hyperlink_elements = run_xml.xpath('.//w:hyperlink', 
-                                         namespaces={'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'})
-        if hyperlink_elements:
-            print(f"    Found hyperlink elements: {len(hyperlink_elements)}")
+        parent = run._r.getparent()
+        if parent is not None and parent.tag == _W_HYPERLINK:
+            logger.debug("    Run is inside a hyperlink element")
             return True
             
         # Check hyperlink-style formatting
         if (run.font.color and hasattr(run.font.color, 'rgb') and 
             run.font.color.rgb == RGBColor(0, 0, 255) and run.underline):
-            print(f"    Has hyperlink-style formatting (blue + underline)")
+            logger.debug("    Has hyperlink-style formatting (blue + underline)")
             return True
             
     except Exception as e:
-        print(f"    Error checking hyperlink: {e}")
+        logger.debug("    Error checking hyperlink: %s", e)
     
     return False
 
@@ -1338,27 +1609,26 @@ def find_runs_to_remove_aggressive(para: Paragraph, target_string: str) -> List[
     """
     runs_to_remove = []
     
+    # Materialize runs and their text once; each run.text walks the XML
+    runs = list(para.runs)
+    texts = [run.text for run in runs]
+    
     # First, find runs containing target text
-    target_start = para.text.lower().find(target_string.lower())
+    target_start = ''.join(texts).lower().find(target_string.lower())
     if target_start == -1:
         return runs_to_remove
     
     target_end = target_start + len(target_string)
     
     # Map character positions to runs
-    char_pos = 0
-    run_ranges = []
+    run_ends = list(accumulate(len(text) for text in texts))
+    run_ranges = [(run, text, run_end - len(text), run_end)
+                  for run, text, run_end in zip(runs, texts, run_ends)]
     
-    for run in para.runs:
-        run_start = char_pos
-        run_end = char_pos + len(run.text)
-        run_ranges.append((run, run_start, run_end))
-        char_pos = run_end
-    
-    print(f"\n🎯 TARGET RANGE: {target_start} to {target_end}")
+    logger.debug("🎯 TARGET RANGE: %s to %s", target_start, target_end)
     
     # Find runs that overlap with target or are adjacent problematic runs
-    for run, run_start, run_end in run_ranges:
+    for run, text, run_start, run_end in run_ranges:
         should_remove = False
         reason = ""
         
@@ -1378,13 +1648,13 @@ def find_runs_to_remove_aggressive(para: Paragraph, target_string: str) -> List[
             reason = "is hyperlink"
         
         # Check if it's a small connector (like period, comma) adjacent to target
-        elif (len(run.text.strip()) <= 2 and 
-              run.text.strip() in '.,;:' and
+        elif (len(text.strip()) <= 2 and 
+              text.strip() in '.,;:' and
               abs(run_start - target_end) <= 5):  # Within 5 chars of target end
             should_remove = True
             reason = "is small connector near target"
         
-        print(f"Run {run_start}-{run_end}: '{run.text}' -> Remove: {should_remove} ({reason})")
+        logger.debug("Run %s-%s: %r -> Remove: %s (%s)", run_start, run_end, text, should_remove, reason)
         
         if should_remove:
             runs_to_remove.append(run)
@@ -1397,99 +1667,87 @@ def build_replacement_components_simple(mapping_row: pd.Series, section_type: st
     """
     Simplified version that focuses on getting the components right.
     """
-    print(f"\n🔨 Building replacement components for {section_type}")
+    logger.debug("🔨 Building replacement components for %s", section_type)
+    
+    # Plain dict lookups are much cheaper than repeated Series.get calls
+    row = mapping_row.to_dict() if isinstance(mapping_row, pd.Series) else mapping_row
     
     components = []
     
-    # Get line columns for this section type
-    line_columns = [col for col in mapping_row.index 
-                   if col.startswith('Line ') and section_type in col]
+    # Get line columns for this section type, sorted by line number
+    indexed_columns = _indexed_line_columns(tuple(row), section_type)
     
-    print(f"Found line columns: {line_columns}")
+    logger.debug("Found line columns: %s", indexed_columns)
     
-    if not line_columns:
-        print("No line columns found")
+    if not indexed_columns:
+        logger.debug("No line columns found")
         return components
     
     # Get hyperlinks and email links
     hyperlinks_col = f'Hyperlinks {section_type}'
     email_col = f'Link for email - {section_type}'
     
-    hyperlinks_str = str(mapping_row.get(hyperlinks_col, '')).strip()
-    email_str = str(mapping_row.get(email_col, '')).strip()
+    hyperlinks_str = _cell(row, hyperlinks_col)
+    email_str = _cell(row, email_col)
     
-    print(f"Hyperlinks: '{hyperlinks_str}'")
-    print(f"Emails: '{email_str}'")
+    logger.debug("Hyperlinks: %r", hyperlinks_str)
+    logger.debug("Emails: %r", email_str)
     
     # Parse hyperlinks and emails (semicolon separated)
-    hyperlinks = [h.strip() for h in hyperlinks_str.split(country_delimiter) 
-                 if h.strip() and h.strip().lower() != 'nan']
-    emails = [e.strip() for e in email_str.split(country_delimiter) 
-             if e.strip() and e.strip().lower() != 'nan']
+    hyperlinks = list(_split_clean(hyperlinks_str, country_delimiter))
+    emails = list(_split_clean(email_str, country_delimiter))
     
-    print(f"Parsed hyperlinks: {hyperlinks}")
-    print(f"Parsed emails: {emails}")
-    
-    # Sort line columns by number
-    def extract_line_number(col_name):
-        match = re.search(r'Line (\d+)', col_name)
-        return int(match.group(1)) if match else 999
-    
-    sorted_columns = sorted(line_columns, key=extract_line_number)
+    logger.debug("Parsed hyperlinks: %s", hyperlinks)
+    logger.debug("Parsed emails: %s", emails)
     
     # Find Line 1 to get countries
-    line_1_col = None
-    for col in sorted_columns:
-        if extract_line_number(col) == 1:
-            line_1_col = col
-            break
+    line_1_col = next((col for line_num, col in indexed_columns if line_num == 1), None)
     
     if not line_1_col:
-        print("No Line 1 column found")
+        logger.debug("No Line 1 column found")
         return components
     
-    line_1_text = str(mapping_row.get(line_1_col, '')).strip()
-    print(f"Line 1 text: '{line_1_text}'")
+    line_1_text = _cell(row, line_1_col)
+    logger.debug("Line 1 text: %r", line_1_text)
     
-    if not line_1_text or line_1_text.lower() == 'nan':
-        print("Line 1 text is empty")
+    if not line_1_text:
+        logger.debug("Line 1 text is empty")
         return components
     
     # Get countries from dedicated bold country column
     bold_countries_col = f'Line 1 - Country names to be bolded - {section_type}'
-    bold_countries_str = str(mapping_row.get(bold_countries_col, '')).strip()
-    print(f"Bold countries column: '{bold_countries_col}' = '{bold_countries_str}'")
+    bold_countries_str = _cell(row, bold_countries_col)
+    logger.debug("Bold countries column: %r = %r", bold_countries_col, bold_countries_str)
     
     # Parse countries using comma/semicolon delimiter
-    if bold_countries_str and bold_countries_str.lower() != 'nan':
+    if bold_countries_str:
         # Try comma first (as seen in mapping file), then semicolon as fallback
         if ',' in bold_countries_str:
-            countries = [c.strip() for c in bold_countries_str.split(',') if c.strip()]
+            countries = list(_split_clean(bold_countries_str, ','))
         else:
-            countries = [c.strip() for c in bold_countries_str.split(country_delimiter) if c.strip()]
-        print(f"Countries from bold column: {countries}")
+            countries = list(_split_clean(bold_countries_str, country_delimiter))
+        logger.debug("Countries from bold column: %s", countries)
     else:
         # Fallback: extract from line text (backwards compatibility)
-        countries = [c.strip() for c in line_1_text.split(country_delimiter) if c.strip()]
-        print(f"Countries from fallback (line text): {countries}")
+        countries = list(_split_clean(line_1_text, country_delimiter))
+        logger.debug("Countries from fallback (line text): %s", countries)
     
     if not countries:
-        print("No countries found")
+        logger.debug("No countries found")
         return components
     
     # Process each line
-    for col in sorted_columns:
-        line_num = extract_line_number(col)
-        content = str(mapping_row.get(col, '')).strip()
+    for line_num, col in indexed_columns:
+        content = _cell(row, col)
         
-        print(f"Processing Line {line_num}: '{content}'")
+        logger.debug("Processing Line %s: %r", line_num, content)
         
-        if not content or content.lower() == 'nan':
+        if not content:
             continue
         
         # Split content by countries using semicolon delimiter
         parts = [p.strip() for p in content.split(country_delimiter)]
-        print(f"  Split into parts: {parts}")
+        logger.debug("  Split into parts: %s", parts)
         
         for i, country in enumerate(countries):
             if i < len(parts) and parts[i]:
@@ -1508,9 +1766,9 @@ def build_replacement_components_simple(mapping_row: pd.Series, section_type: st
                 }
                 
                 components.append(component)
-                print(f"  Added component: {component}")
+                logger.debug("  Added component: %s", component)
     
-    print(f"Total components built: {len(components)}")
+    logger.debug("Total components built: %s", len(components))
     return components
 
 
@@ -1519,8 +1777,8 @@ def insert_replacement_simple(para: Paragraph, insertion_point: int, components:
     """
     Simplified insertion that adds text at the insertion point.
     """
-    print(f"\n📝 INSERTING REPLACEMENT at position {insertion_point}")
-    print(f"Components to insert: {len(components)}")
+    logger.debug("📝 INSERTING REPLACEMENT at position %s", insertion_point)
+    logger.debug("Components to insert: %s", len(components))
     
     # Group components by line
     lines = {}
@@ -1562,15 +1820,15 @@ def insert_replacement_simple(para: Paragraph, insertion_point: int, components:
     
     # For PL sections, append the additional text
     if section_type == "PL":
-        additional_text = str(mapping_row.get('Text to be appended after National reporting system PL', '')).strip()
-        if additional_text and additional_text.lower() != 'nan':
+        additional_text = _cell(mapping_row, 'Text to be appended after National reporting system PL')
+        if additional_text:
             replacement_text += f"\n\n{additional_text}"
     
-    print(f"Replacement text: '{replacement_text}'")
+    logger.debug("Replacement text: %r", replacement_text)
     
     # Simple insertion - add a new run with the replacement text
     new_run = para.add_run(replacement_text)
-    print("✅ Replacement text inserted")
+    logger.debug("✅ Replacement text inserted")
     
     return True
 
@@ -1579,26 +1837,49 @@ def run_annex_update_v2(doc: Document, mapping_row: pd.Series, section_type: str
                        cached_components: Optional[List] = None, 
                        country_delimiter: str = ";") -> Tuple[bool, Optional[List]]:
     """Update national reporting systems in SmPC or PL sections."""
+    found, components, _ = _run_annex_update(
+        doc, mapping_row, section_type, cached_components, country_delimiter
+    )
+    return found, components
+
+
+def _national_reporting_target(mapping_row: pd.Series, section_type: str) -> str:
+    """Return the national reporting text to replace for a section, without any label prefix."""
+    target_string = _cell(mapping_row, f'Original text national reporting - {section_type}')
+    before, sep, after = target_string.partition(':')
+    return (after if sep else before).strip()
+
+
+def _run_annex_update(doc: Document, mapping_row: pd.Series, section_type: str,
+                      cached_components: Optional[List] = None,
+                      country_delimiter: str = ";",
+                      start_index: int = 0) -> Tuple[bool, Optional[List], Optional[int]]:
+    """
+    Body of run_annex_update_v2, scanning body paragraphs from start_index.
+
+    Also returns the index of the updated paragraph so a following pass for
+    the same target text can resume there instead of rescanning the body.
+    """
     # Get the target text to find and replace
-    target_col = f'Original text national reporting - {section_type}'
-    target_string = str(mapping_row.get(target_col, '')).strip()
-    
-    if ":" in target_string:
-        target_string = target_string.split(':', 1)[-1].strip()
+    target_string = _national_reporting_target(mapping_row, section_type)
 
-    if not target_string or target_string.lower() == 'nan':
-        return False, None
+    if not target_string:
+        return False, None, None
 
     # Get replacement components
     components = get_replacement_components(mapping_row, section_type, cached_components, country_delimiter)
     
     if not components:
-        return False, None
+        return False, None, None
     
     # Find and update the target text
     found = False
-    for para in doc.paragraphs:
-        if target_string.lower() in para.text.lower():
+    target_lower = target_string.lower()
+    if not _body_may_contain(doc, target_lower):
+        return False, components, None
+    paragraphs = islice(_iter_paragraphs(doc), start_index, None)
+    for index, para in enumerate(paragraphs, start_index):
+        if target_lower in para.text.lower():
             
             # Find runs to remove - enhanced with XML-based hyperlink handling
             runs_to_remove = find_runs_to_remove(para, target_string)
@@ -1606,23 +1887,27 @@ def run_annex_update_v2(doc: Document, mapping_row: pd.Series, section_type: str
             if runs_to_remove:
                 # Remove only the identified runs (traditional approach)
                 print(f"Removing {len(runs_to_remove)} specific runs...")
+                # Group run elements by parent so each parent is resolved once
+                by_parent = defaultdict(list)
                 for run in runs_to_remove:
-                    try:
-                        run._element.getparent().remove(run._element)
-                        print(f"  Removed: '{run.text[:30]}...'")
-                    except Exception as e:
-                        print(f"  Error removing run: {e}")
-
-                # Check remaining text
+                    element = run._element
+                    parent = element.getparent()
+                    if parent is not None:
+                        by_parent[parent].append(element)
+                for parent, elements in by_parent.items():
+                    for element in elements:
+                        parent.remove(element)
+
+            # The remaining text is only needed for diagnostics; skip the re-walk otherwise
+            if logger.isEnabledFor(logging.DEBUG):
                 remaining_text = para.text.strip()
-                print(f"Text after removal: '{remaining_text}'")
-            else:
+                if runs_to_remove:
+                    logger.debug("Text after removal: %r", remaining_text)
                 # Empty list could mean XML removal was already done, or no runs to remove
-                remaining_text = para.text.strip()
-                if target_string.lower() in remaining_text.lower():
-                    print(f"Target still present - XML removal may have failed")
+                elif target_string.lower() in remaining_text.lower():
+                    logger.debug("Target still present - XML removal may have failed")
                 else:
-                    print(f"XML-based removal completed - proceeding with insertion")
+                    logger.debug("XML-based removal completed - proceeding with insertion")
 
             # Insert formatted replacement at the end of the paragraph (ALWAYS after removal)
             try:
@@ -1637,8 +1922,8 @@ def run_annex_update_v2(doc: Document, mapping_row: pd.Series, section_type: str
 
                 # For PL sections, append additional text
                 if section_type == "PL":
-                    additional_text = str(mapping_row.get('Text to be appended after National reporting system PL', '')).strip()
-                    if additional_text and additional_text.lower() != 'nan':
+                    additional_text = _cell(mapping_row, 'Text to be appended after National reporting system PL')
+                    if additional_text:
                         para.add_run(f"\n\n{additional_text}")
 
             except Exception as e:
@@ -1646,12 +1931,12 @@ def run_annex_update_v2(doc: Document, mapping_row: pd.Series, section_type: str
                 import traceback
                 traceback.print_exc()
                 # Return False but still return components (not the error message)
-                return False, components
+                return False, components, None
 
             found = True
             break
     
-    return found, components
+    return found, components, index if found else None
 
 
 def update_document_with_fixed_smpc_blocks(doc: Document, mapping_row: pd.Series) -> Tuple[bool, List[str]]:
@@ -1670,16 +1955,23 @@ def update_document_with_fixed_smpc_blocks(doc: Document, mapping_row: pd.Series
         country_delimiter = ";"  # This should come from ProcessingConfig
         
         # 1. Update SmPC national reporting systems
-        smpc_success, smpc_components = run_annex_update_v2(
+        smpc_success, smpc_components, smpc_index = _run_annex_update(
             doc, mapping_row, "SmPC", None, country_delimiter=country_delimiter
         )
         if smpc_success:
             updates_applied.append("SmPC national reporting")
             total_success = True
 
-        # 2. Update PL national reporting systems
-        pl_success, _ = run_annex_update_v2(
-            doc, mapping_row, "PL", smpc_components if smpc_success else None, country_delimiter=country_delimiter
+        # 2. Update PL national reporting systems. When both sections replace
+        # the same text, no paragraph before the SmPC match can contain it
+        # (that pass read them and left them unchanged), so resume from there.
+        pl_start = 0
+        if smpc_success and (_national_reporting_target(mapping_row, "PL").lower()
+                             == _national_reporting_target(mapping_row, "SmPC").lower()):
+            pl_start = smpc_index
+        pl_success, _, _ = _run_annex_update(
+            doc, mapping_row, "PL", smpc_components if smpc_success else None,
+            country_delimiter=country_delimiter, start_index=pl_start
         )
         if pl_success:
             updates_applied.append("PL national reporting")
@@ -1698,9 +1990,9 @@ def handle_pl_additional_text(para: Paragraph, mapping_row: pd.Series) -> bool:
     This text comes from the "Text to be appended after National reporting system PL" column
     and provides additional safety reporting information.
     """
-    additional_text = str(mapping_row.get('Text to be appended after National reporting system PL', '')).strip()
+    additional_text = _cell(mapping_row, 'Text to be appended after National reporting system PL')
     
-    if not additional_text or additional_text.lower() == 'nan':
+    if not additional_text:
         return False
     
     # Add spacing and the additional text
@@ -1720,18 +2012,18 @@ def create_pl_replacement_block(mapping_row: pd.Series, country_delimiter: str =
     This handles the case where PL uses block format rather than line-by-line format.
     """
     # Get main PL content
-    main_content = str(mapping_row.get('National reporting system PL', '')).strip()
+    main_content = _cell(mapping_row, 'National reporting system PL')
     
     # Get additional text
-    additional_text = str(mapping_row.get('Text to be appended after National reporting system PL', '')).strip()
+    additional_text = _cell(mapping_row, 'Text to be appended after National reporting system PL')
     
     # Combine them
     full_content = []
     
-    if main_content and main_content.lower() != 'nan':
+    if main_content:
         full_content.append(main_content)
     
-    if additional_text and additional_text.lower() != 'nan':
+    if additional_text:
         full_content.append(additional_text)
     
     return '\n\n'.join(full_content) if full_content else ''
@@ -1762,21 +2054,28 @@ def _find_section_10_header(doc: Document, date_header: str) -> Optional[int]:
     date_header_normalized = normalize_text(date_header)
     print(f"🔍 DEBUG: Looking for normalized header: '{date_header_normalized}'")
     
+    date_words = set(date_header_normalized.split())
+    
+    # Extract each paragraph's text once; both passes and the previous-paragraph check reuse it
+    texts = [get_full_paragraph_text(para) for para in _iter_paragraphs(doc)]
+    
+    # Normalized texts from the first pass, reused by the second pass
+    normalized_texts = {}
+    
     # FIRST PASS: Look for exact header match (regardless of "10" presence)
     # This handles cases where the header text is in a separate paragraph
-    for idx, para in enumerate(doc.paragraphs):
-        text = get_full_paragraph_text(para)
+    for idx, text in enumerate(texts):
         if not text:
             continue
         
-        text_normalized = normalize_text(text)
+        text_normalized = normalized_texts[idx] = normalize_text(text)
         
         # Exact match of the date header
         if date_header_normalized == text_normalized:
             # Check if previous paragraph contains "10." to confirm it's Section 10
             if idx > 0:
-                prev_text = get_full_paragraph_text(doc.paragraphs[idx - 1])
-                if '10' in prev_text.lower():
+                prev_text = texts[idx - 1]
+                if '10' in prev_text:
                     print(f"✅ Found Section 10 header at paragraph {idx} (header after section number)")
                     print(f"   Previous para {idx-1}: '{prev_text}'")
                     print(f"   Header para {idx}: '{text}'")
@@ -1788,25 +2087,22 @@ def _find_section_10_header(doc: Document, date_header: str) -> Optional[int]:
             return idx
         
         # Fuzzy match for the header text alone
-        if len(text_normalized) < 100:  # Headers are usually short
-            date_words = set(date_header_normalized.split())
+        if date_words and len(text_normalized) < 100:  # Headers are usually short
             text_words = set(text_normalized.split())
-            
-            if len(date_words) > 0:
-                match_ratio = len(date_words & text_words) / len(date_words)
-                if match_ratio >= 0.8:  # High threshold for non-"10" matches
-                    print(f"✅ Found Section 10 header at paragraph {idx} (fuzzy match {match_ratio:.0%})")
-                    print(f"   Text: '{text}'")
-                    return idx
+            match_ratio = len(date_words & text_words) / len(date_words)
+            if match_ratio >= 0.8:  # High threshold for non-"10" matches
+                print(f"✅ Found Section 10 header at paragraph {idx} (fuzzy match {match_ratio:.0%})")
+                print(f"   Text: '{text}'")
+                return idx
     
     # SECOND PASS: Look for "10." combined with header text in same paragraph
     # This is the traditional format
-    for idx, para in enumerate(doc.paragraphs):
-        text = get_full_paragraph_text(para)
+    for idx, text in enumerate(texts):
+        # Cheapest rejects first: raw digit check, then the short '10.' probe
         if not text or '10' not in text:
             continue
         
-        text_normalized = normalize_text(text)
+        text_normalized = normalized_texts[idx]
         
         if '10.' in text_normalized and date_header_normalized in text_normalized:
             print(f"✅ Found Section 10 header at paragraph {idx} (combined format)")
@@ -1814,52 +2110,56 @@ def _find_section_10_header(doc: Document, date_header: str) -> Optional[int]:
             return idx
     
     print(f"❌ Could not find Section 10 header")
-    print(f"   Searched {len(doc.paragraphs)} paragraphs")
+    print(f"   Searched {len(texts)} paragraphs")
     return None
 
 
-def _insert_date_after_header(doc: Document, header_index: int, formatted_date: str) -> bool:
+def _set_paragraph_text(para: Paragraph, text: str) -> None:
+    """
+    Replace a paragraph's content with one non-bold run holding ``text``.
+
+    Same XML as ``para.clear()`` followed by ``add_run(text)`` and
+    ``run.bold = False``.
+    """
+    p = para._p
+    for child in list(p):
+        if isinstance(child.tag, str) and child.tag != _W_PPR:
+            p.remove(child)
+    p.append(_new_run(text, bold=False))
+
+
+def _insert_date_after_header(header_para: Paragraph, formatted_date: str) -> bool:
     """
     Insert date content in the paragraph immediately following the header.
 
     Args:
-        doc: Document object
-        header_index: Index of the Section 10 header paragraph
+        header_para: The Section 10 header paragraph
         formatted_date: Formatted date string to insert
 
     Returns:
         bool: True if successful
     """
     try:
-        # Check if next paragraph exists
-        if header_index + 1 < len(doc.paragraphs):
-            next_para = doc.paragraphs[header_index + 1]
+        header_p = header_para._p
+
+        # Check if next paragraph exists (same paragraph doc.paragraphs would list next)
+        next_p = next(header_p.itersiblings(_W_P), None)
+        if next_p is not None:
+            next_para = Paragraph(next_p, header_para._parent)
 
             # Clear existing content and insert date
-            next_para.clear()
-            run = next_para.add_run(formatted_date)
-            run.bold = False
-            print(f"✅ Date inserted in existing paragraph {header_index + 1}")
+            _set_paragraph_text(next_para, formatted_date)
+            print(f"✅ Date inserted in existing paragraph after header")
             return True
 
         else:
-            # Create new paragraph after header
-            # We need to use a different approach since python-docx doesn't have direct insertion
-            # Let's add a paragraph at the end and then move content around
-            new_para = doc.add_paragraph()
-            run = new_para.add_run(formatted_date)
-            run.bold = False
-
-            # Move the new paragraph to the correct position
-            # This is a workaround - we add at end then reorder
-            paragraphs = doc.paragraphs
-            if len(paragraphs) > header_index + 2:
-                # Move the last paragraph (our new one) to position header_index + 1
-                last_para_element = paragraphs[-1]._element
-                header_para_element = paragraphs[header_index]._element
-                header_para_element.addnext(last_para_element)
+            # Create new paragraph directly after header
+            new_p = OxmlElement('w:p')
+            header_p.addnext(new_p)
+            new_para = Paragraph(new_p, header_para._parent)
+            _set_paragraph_text(new_para, formatted_date)
 
-            print(f"✅ Created new paragraph after header at position {header_index + 1}")
+            print(f"✅ Created new paragraph after header")
             return True
 
     except Exception as e:
@@ -1909,7 +2209,8 @@ def update_section_10_date(doc: Document, mapping_row: pd.Series, mapping_file_p
         return False
 
     # NEW: Insert date in next paragraph, preserving header
-    success = _insert_date_after_header(doc, header_index, formatted_date)
+    header_para = next(islice(_iter_paragraphs(doc), header_index, None))
+    success = _insert_date_after_header(header_para, formatted_date)
     if success:
         print(f"✅ Section 10 date inserted successfully for {country}")
     else:
@@ -1919,8 +2220,8 @@ def update_section_10_date(doc: Document, mapping_row: pd.Series, mapping_file_p
 
 def update_annex_iiib_date(doc: Document, mapping_row: pd.Series, mapping_file_path: Optional[str] = None) -> bool:
     """Update date in Annex IIIB Section 6."""
-    country = mapping_row.get('Country', '')
-    date_text = mapping_row.get('Annex IIIB Date Text', 'This leaflet was last revised in')
+    country = _cell(mapping_row, 'Country')
+    date_text = _cell(mapping_row, 'Annex IIIB Date Text') or 'This leaflet was last revised in'
     
     if not country:
         return False
@@ -1937,14 +2238,12 @@ def update_annex_iiib_date(doc: Document, mapping_row: pd.Series, mapping_file_p
     except Exception:
         formatted_date = datetime.now().strftime("%d %B %Y")
     
+    date_text_lower = date_text.lower()
     found = False
-    for para in doc.paragraphs:
+    for para in _iter_paragraphs(doc):
         text_lower = para.text.lower()
         
-        if (date_text.lower() in text_lower or
-            'leaflet was last revised' in text_lower or
-            'dernière approbation' in text_lower or
-            'última revisión' in text_lower):
+        if date_text_lower in text_lower or _DATE_KW_RE.search(text_lower):
             
             para.clear()
             run = para.add_run(f"{date_text} {formatted_date}")
@@ -1969,7 +2268,7 @@ def filter_local_representatives(doc: Document, mapping_row: pd.Series) -> bool:
     Returns:
         bool: True if local representatives were successfully filtered
     """
-    country = str(mapping_row.get('Country', '')).strip()
+    country = _cell(mapping_row, 'Country')
 
     print(f"🔧 DEBUG: filter_local_representatives called")
     print(f"   Country extracted: '{country}'")
@@ -1980,11 +2279,11 @@ def filter_local_representatives(doc: Document, mapping_row: pd.Series) -> bool:
 
     # Try table-based processing first (new capability)
     print("🔧 DEBUG: Attempting table-based processing...")
+    global _TABLE_PROCESSOR
     try:
-        from .local_rep_table_processor import LocalRepTableProcessor
-
-        table_processor = LocalRepTableProcessor()
-        table_result = table_processor.process_local_rep_table(doc, mapping_row)
+        if _TABLE_PROCESSOR is None:
+            _TABLE_PROCESSOR = LocalRepTableProcessor()
+        table_result = _TABLE_PROCESSOR.process_local_rep_table(doc, mapping_row)
         print(f"🔧 DEBUG: Table processing result: {table_result}")
 
         if table_result:
@@ -2012,16 +2311,16 @@ def _filter_local_representatives_paragraphs(doc: Document, mapping_row: pd.Seri
     Preserved for backward compatibility and documents that don't use table format.
     """
     # Get applicable local representatives for this language/country
-    applicable_reps = str(mapping_row.get('Local Representative', '')).strip()
-    country = str(mapping_row.get('Country', '')).strip()
-    language = str(mapping_row.get('Language', '')).strip()
+    applicable_reps = _cell(mapping_row, 'Local Representative')
+    country = _cell(mapping_row, 'Country')
+    language = _cell(mapping_row, 'Language')
 
-    if not applicable_reps or applicable_reps.lower() == 'nan':
+    if not applicable_reps:
         return False
     # Parse countries that should be bold formatted
-    bold_countries_str = str(mapping_row.get('Country names to be bolded - Local Reps', '')).strip()
-    bold_countries = [c.strip() for c in bold_countries_str.split(',')
-                     if c.strip() and c.strip().lower() != 'nan']
+    bold_countries_str = _cell(mapping_row, 'Country names to be bolded - Local Reps')
+    bold_countries = list(_split_clean(bold_countries_str, ','))
+    country_cf = country.casefold()
 
     found = False
     in_section_6 = False
@@ -2029,8 +2328,10 @@ def _filter_local_representatives_paragraphs(doc: Document, mapping_row: pd.Seri
     paragraphs_to_remove = []
 
     # Phase 1: Identify Section 6 and locate local representative paragraphs
-    for idx, para in enumerate(doc.paragraphs):
-        text_lower = para.text.lower()
+    for para in _iter_paragraphs(doc):
+        # Read the paragraph text once; every check below reuses it
+        text = para.text
+        text_lower = text.lower()
 
         # Check if we're entering Section 6
         if ('6.' in text_lower and 'contents of the pack' in text_lower) or \
@@ -2040,7 +2341,7 @@ def _filter_local_representatives_paragraphs(doc: Document, mapping_row: pd.Seri
             continue
 
         # Check if we've left Section 6 (entering next section)
-        if in_section_6 and _is_section_header(para.text):
+        if in_section_6 and _is_section_header(text):
             break
 
         # Look for local representative section header
@@ -2050,28 +2351,24 @@ def _filter_local_representatives_paragraphs(doc: Document, mapping_row: pd.Seri
 
         # Collect local rep entries to potentially remove
         if in_local_rep_section:
-            # Stop if we hit marketing auth holder or other major section
-            if ('marketing authorisation holder' in text_lower or
-                'manufacturing authorisation holder' in text_lower or
-                'this leaflet was last revised' in text_lower or
-                _is_section_header(para.text)):
+            # Stop if we hit marketing auth holder (section headers already ended the loop above)
+            if _SEC6_END_RE.search(text_lower):
                 break
 
             # Check if this paragraph contains a local rep entry
-            if _contains_country_local_rep_entry(para.text):
+            if _contains_country_local_rep_entry(text):
                 # Determine if this local rep should be kept or removed
-                if not _should_keep_local_rep_entry(para.text, country, applicable_reps):
-                    paragraphs_to_remove.append(idx)
+                if not _should_keep_local_rep_entry(text.casefold(), country_cf):
+                    paragraphs_to_remove.append(para)
                 else:
-                    # This is the applicable local rep - apply bold formatting
+                    # This is the applicable local rep - apply bold formatting.
+                    # Keep scanning: entries after it still have to be removed,
+                    # and the section boundaries above end the loop.
                     _apply_bold_formatting_to_paragraph(para, bold_countries)
                     found = True
 
     # Phase 2: Remove non-applicable local representative paragraphs
-    # Remove in reverse order to maintain correct indices
-    for idx in reversed(paragraphs_to_remove):
-        # Get the paragraph to remove
-        para_to_remove = doc.paragraphs[idx]
+    for para_to_remove in paragraphs_to_remove:
         # Remove the paragraph's content
         para_to_remove.clear()
 
@@ -2088,17 +2385,24 @@ def _contains_country_local_rep_entry(text: str) -> bool:
         return False
         
     # Look for patterns like "Germany:", "France:", "Ireland:", etc.
-    import re
-    # Match country name at start of line followed by colon
-    return bool(re.match(r'^[A-Za-z\s]+:', text_stripped))
+    return _COUNTRY_REP_RE.match(text_stripped) is not None
 
 
-def _should_keep_local_rep_entry(para_text: str, target_country: str, applicable_reps: str) -> bool:
+def _should_keep_local_rep_entry(para_text_cf: str, target_country_cf: str) -> bool:
     """
     Determine if a local representative entry should be kept based on the target country.
+
+    Both arguments must already be casefolded so callers can fold the country once.
     """
     # Check if the paragraph contains the target country
-    return target_country.lower() in para_text.lower()
+    return target_country_cf in para_text_cf
+
+
+@lru_cache(maxsize=512)
+def _countries_re(countries: Tuple[str, ...]) -> re.Pattern:
+    """Case-insensitive alternation of country names, longest first."""
+    ordered = sorted(countries, key=len, reverse=True)
+    return re.compile('|'.join(re.escape(country) for country in ordered), re.IGNORECASE)
 
 
 def _apply_bold_formatting_to_paragraph(para: Paragraph, bold_countries: list) -> None:
@@ -2114,70 +2418,49 @@ def _apply_bold_formatting_to_paragraph(para: Paragraph, bold_countries: list) -
     # Clear and rebuild the paragraph with proper formatting
     para.clear()
     
-    remaining_text = current_text
-    for country in bold_countries:
-        if country.lower() in remaining_text.lower():
-            # Find the country name (case-insensitive)
-            import re
-            match = re.search(re.escape(country), remaining_text, re.IGNORECASE)
-            if match:
-                # Add text before country name
-                before_text = remaining_text[:match.start()]
-                if before_text:
-                    para.add_run(before_text)
-                
-                # Add country name with bold formatting
-                bold_run = para.add_run(match.group())
-                bold_run.bold = True
-                
-                # Continue with remaining text
-                remaining_text = remaining_text[match.end():]
+    # Walk the text once, bolding the first occurrence of each country name
+    pos = 0
+    seen = set()
+    for match in _countries_re(tuple(bold_countries)).finditer(current_text):
+        key = match.group().lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        
+        # Add text before country name
+        if match.start() > pos:
+            para.add_run(current_text[pos:match.start()])
+        
+        # Add country name with bold formatting
+        bold_run = para.add_run(match.group())
+        bold_run.bold = True
+        pos = match.end()
     
     # Add any remaining text
-    if remaining_text:
-        para.add_run(remaining_text)
+    if pos < len(current_text):
+        para.add_run(current_text[pos:])
 
 
 def _is_section_header(text: str) -> bool:
     """Check if text appears to be a section header (like "7.", "8.", etc.)"""
-    text_lower = text.strip().lower()
     # Look for patterns like "7.", "section 7", etc.
-    import re
-    return bool(re.match(r'^\s*\d+\.', text) or re.match(r'^\s*section\s+\d+', text_lower))
-
-
-def update_local_representatives(doc: Document, mapping_row: pd.Series) -> bool:
-    """
-    Update local representatives - wrapper function with debug logging.
-
-    This function is called by the main processing workflow and delegates to
-    the enhanced filter_local_representatives function.
-    """
-    country = mapping_row.get('Country', 'MISSING')
-    language = mapping_row.get('Language', 'MISSING')
-    local_rep_data = mapping_row.get('Local Representative', 'MISSING')
-
-    print(f"🔧 DEBUG: Starting local rep processing")
-    print(f"   Country: {country}")
-    print(f"   Language: {language}")
-    print(f"   Local Rep Data: {local_rep_data[:100] if isinstance(local_rep_data, str) else local_rep_data}")
-    print(f"   Document has {len(doc.tables)} tables")
-
-    try:
-        result = filter_local_representatives(doc, mapping_row)
-        print(f"🔧 DEBUG: Local rep processing result: {result}")
-        if result:
-            print("✅ Local rep processing succeeded!")
-        else:
-            print("❌ Local rep processing returned False")
-        return result
-    except Exception as e:
-        print(f"💥 DEBUG: Local rep processing failed with exception: {e}")
-        import traceback
-        traceback.print_exc()
+    stripped = text.lstrip()
+    if not stripped:
         return False
 
-
+    first = stripped[0]
+    if first.isdecimal():
+        # Numbered header: a run of digits followed by a dot
+        end = len(stripped)
+        i = 1
+        while i < end and stripped[i].isdecimal():
+            i += 1
+        return i < end and stripped[i] == '.'
+
+    # Only text starting with an s can be a "section N" header
+    if first in 'sSſ':
+        return _SECTION_RE.match(stripped) is not None
+    return False
 
 
 # Legacy function for backwards compatibility - now calls the new filtering function
@@ -2199,7 +2482,7 @@ def split_annexes(source_path: str, output_dir: str, language: str, country: str
     ENHANCED VERSION: Uses clone-and-prune approach for perfect document preservation.
     This preserves ALL formatting, hyperlinks, headers, footers, and scaffolding.
     """
-    print("🚀 Using enhanced clone-and-prune document splitting")
+    logger.debug("🚀 Using enhanced clone-and-prune document splitting")
 
     try:
         # Get actual headers from mapping file (what's really in the document)
@@ -2207,10 +2490,10 @@ def split_annexes(source_path: str, output_dir: str, language: str, country: str
         annex_ii_header = str(mapping_row.get('Annex II Header in country language', 'ANNEX II')).strip()
         annex_iiib_header = str(mapping_row.get('Annex IIIB Header in country language', 'ANNEX III')).strip()
 
-        print(f"📋 Using headers from mapping file:")
-        print(f"   Annex I: '{annex_i_header}'")
-        print(f"   Annex II: '{annex_ii_header}'")
-        print(f"   Annex IIIB: '{annex_iiib_header}'")
+        logger.debug("📋 Using headers from mapping file:")
+        logger.debug("   Annex I: %r", annex_i_header)
+        logger.debug("   Annex II: %r", annex_ii_header)
+        logger.debug("   Annex IIIB: %r", annex_iiib_header)
 
         # Use clone-and-prune approach with actual document headers
         result_paths = clone_and_split_document(
@@ -2230,14 +2513,14 @@ def split_annexes(source_path: str, output_dir: str, language: str, country: str
         if not annex_i_path or not annex_iiib_path:
             raise ValueError(f"Failed to split document - could not find required annexes. Found: {list(result_paths.keys())}")
 
-        print(f"✅ Successfully split documents using clone-and-prune:")
-        print(f"   ANNEX I: {annex_i_path}")
-        print(f"   ANNEX IIIB: {annex_iiib_path}")
+        logger.debug("✅ Successfully split documents using clone-and-prune:")
+        logger.debug("   ANNEX I: %s", annex_i_path)
+        logger.debug("   ANNEX IIIB: %s", annex_iiib_path)
 
         return annex_i_path, annex_iiib_path
 
     except Exception as e:
-        print(f"❌ Clone-and-prune error: {e}")
+        logger.error("❌ Clone-and-prune error: %s", e)
         raise ProcessingError(f"Document splitting failed: {e}") from e
 
 
@@ -2254,7 +2537,13 @@ def debug_three_header_structure(source_path: str, mapping_row: pd.Series) -> No
         mapping_row: Mapping row with header information
     """
     
+    # All output goes to the debug log; skip loading the document otherwise
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    
     doc = Document(source_path)
+    # One traversal of the body: paragraph texts are reused for matching and counts
+    texts = [para.text.strip() for para in doc.paragraphs]
     country = mapping_row.get('Country', 'Unknown')
     language = mapping_row.get('Language', 'Unknown')
     
@@ -2263,55 +2552,64 @@ def debug_three_header_structure(source_path: str, mapping_row: pd.Series) -> No
     annex_ii_header = str(mapping_row.get('Annex II Header in country language', '')).strip()
     annex_iiib_header = str(mapping_row.get('Annex IIIB Header in country language', '')).strip()
     
-    print(f"\n🔍 THREE-HEADER DEBUGGING")
-    print(f"File: {Path(source_path).name}")
-    print(f"Country: {country} ({language})")
-    print(f"Total paragraphs: {len(doc.paragraphs)}")
-    print(f"Expected Annex I header: '{annex_i_header}'")
-    print(f"Expected Annex II header: '{annex_ii_header}'")
-    print(f"Expected Annex IIIB header: '{annex_iiib_header}'")
-    print("=" * 80)
+    logger.debug("🔍 THREE-HEADER DEBUGGING")
+    logger.debug("File: %s", Path(source_path).name)
+    logger.debug("Country: %s (%s)", country, language)
+    logger.debug("Total paragraphs: %s", len(texts))
+    logger.debug("Expected Annex I header: %r", annex_i_header)
+    logger.debug("Expected Annex II header: %r", annex_ii_header)
+    logger.debug("Expected Annex IIIB header: %r", annex_iiib_header)
+    logger.debug("=" * 80)
     
     # Find all matches for each header
     annex_i_matches = []
     annex_ii_matches = []
     annex_iiib_matches = []
     
-    for idx, para in enumerate(doc.paragraphs):
-        text = para.text.strip()
-        
-        if _is_header_match(text, annex_i_header):
-            annex_i_matches.append({'index': idx, 'text': text})
-        
-        if _is_header_match(text, annex_ii_header):
-            annex_ii_matches.append({'index': idx, 'text': text})
+    # Normalize each header and compile its word-boundary pattern once
+    header_checks = [
+        (_normalize_text_for_matching(header), matches)
+        for header, matches in ((annex_i_header, annex_i_matches),
+                                (annex_ii_header, annex_ii_matches),
+                                (annex_iiib_header, annex_iiib_matches))
+    ]
+    header_checks = [(header_normalized, _word_boundary_re(header_normalized), matches)
+                     for header_normalized, matches in header_checks]
+    
+    for idx, text in enumerate(texts):
+        para_normalized = _normalize_text_for_matching(text)
         
-        if _is_header_match(text, annex_iiib_header):
-            annex_iiib_matches.append({'index': idx, 'text': text})
+        # Same rules as _is_header_match, with the paragraph normalized once
+        for header_normalized, header_re, matches in header_checks:
+            if (para_normalized == header_normalized
+                    or header_re.search(para_normalized)
+                    or (not _are_similar_headers(para_normalized, header_normalized)
+                        and para_normalized.startswith(header_normalized + " "))):
+                matches.append({'index': idx, 'text': text})
     
     # Display results
-    print(f"📌 HEADER MATCHES FOUND:")
+    logger.debug("📌 HEADER MATCHES FOUND:")
     
-    print(f"\nAnnex I ('{annex_i_header}'):")
+    logger.debug("Annex I (%r):", annex_i_header)
     if annex_i_matches:
         for match in annex_i_matches:
-            print(f"  Para {match['index']}: '{match['text'][:60]}...'")
+            logger.debug("  Para %s: '%s...'", match['index'], match['text'][:60])
     else:
-        print(f"  ❌ No matches found")
+        logger.debug("  ❌ No matches found")
     
-    print(f"\nAnnex II ('{annex_ii_header}'):")
+    logger.debug("Annex II (%r):", annex_ii_header)
     if annex_ii_matches:
         for match in annex_ii_matches:
-            print(f"  Para {match['index']}: '{match['text'][:60]}...'")
+            logger.debug("  Para %s: '%s...'", match['index'], match['text'][:60])
     else:
-        print(f"  ❌ No matches found")
+        logger.debug("  ❌ No matches found")
     
-    print(f"\nAnnex IIIB ('{annex_iiib_header}'):")
+    logger.debug("Annex IIIB (%r):", annex_iiib_header)
     if annex_iiib_matches:
         for match in annex_iiib_matches:
-            print(f"  Para {match['index']}: '{match['text'][:60]}...'")
+            logger.debug("  Para %s: '%s...'", match['index'], match['text'][:60])
     else:
-        print(f"  ❌ No matches found")
+        logger.debug("  ❌ No matches found")
     
     # Validate structure if all headers found
     if annex_i_matches and annex_ii_matches and annex_iiib_matches:
@@ -2319,17 +2617,17 @@ def debug_three_header_structure(source_path: str, mapping_row: pd.Series) -> No
         best_ii = annex_ii_matches[0]['index'] 
         best_iiib = annex_iiib_matches[0]['index']
         
-        print(f"\n📊 PROPOSED STRUCTURE:")
-        print(f"   Annex I: paragraphs {best_i} to {best_ii-1} ({best_ii - best_i} paragraphs)")
-        print(f"   Annex II: paragraphs {best_ii} to {best_iiib-1} ({best_iiib - best_ii} paragraphs)")
-        print(f"   Annex IIIB: paragraphs {best_iiib} to end ({len(doc.paragraphs) - best_iiib} paragraphs)")
+        logger.debug("📊 PROPOSED STRUCTURE:")
+        logger.debug("   Annex I: paragraphs %s to %s (%s paragraphs)", best_i, best_ii-1, best_ii - best_i)
+        logger.debug("   Annex II: paragraphs %s to %s (%s paragraphs)", best_ii, best_iiib-1, best_iiib - best_ii)
+        logger.debug("   Annex IIIB: paragraphs %s to end (%s paragraphs)", best_iiib, len(texts) - best_iiib)
         
         if best_i >= best_ii or best_ii >= best_iiib:
-            print(f"  ❌ STRUCTURE ERROR: Headers not in correct order!")
+            logger.debug("  ❌ STRUCTURE ERROR: Headers not in correct order!")
         else:
-            print(f"  ✅ Structure looks good!")
+            logger.debug("  ✅ Structure looks good!")
     else:
-        print(f"\n❌ Cannot validate structure - missing header matches")
+        logger.debug("❌ Cannot validate structure - missing header matches")
 
 
 
@@ -2361,16 +2659,14 @@ def _contains_as_words(text: str, search_term: str) -> bool:
     Check if search_term exists as complete words in text, not just as substring.
     This prevents "annex i" from matching "annex ii".
     """
-    import re
-    
-    # Escape special regex characters in search term
-    escaped_term = re.escape(search_term)
-    
-    # Use word boundaries to ensure complete word matching
+    return _word_boundary_re(search_term).search(text) is not None
+
+
+@lru_cache(maxsize=512)
+def _word_boundary_re(search_term: str) -> re.Pattern:
+    """Case-insensitive pattern matching ``search_term`` as complete words."""
     # \b ensures we match complete words, not substrings
-    pattern = r'\b' + escaped_term + r'\b'
-    
-    return bool(re.search(pattern, text, re.IGNORECASE))
+    return re.compile(r'\b' + re.escape(search_term) + r'\b', re.IGNORECASE)
 
 
 def _are_similar_headers(text1: str, text2: str) -> bool:
@@ -2380,72 +2676,25 @@ def _are_similar_headers(text1: str, text2: str) -> bool:
     
     Uses comprehensive patterns based on actual mapping data from all supported languages.
     """
-    
-    # Comprehensive annex header base words from mapping data
-    annex_base_words = [
-        'bijlage',      # Dutch
-        'annexe',       # French  
-        'anhang',       # German
-        'lisa',         # Estonian
-        'παραρτημα',    # Greek
-        'pielikums',    # Latvian
-        'priedas',      # Lithuanian
-        'anexo',        # Spanish/Portuguese
-        'prilog',       # Croatian
-        'priloga',      # Slovenian
-        'liite',        # Finnish
-        'bilaga',       # Swedish
-        'allegato',     # Italian
-        'annex',        # English
-        'anness',       # Maltese
-        'bilag',        # Danish
-        'viðauki',      # Icelandic
-        'vedlegg',      # Norwegian
-        'příloha',      # Czech
-        'aneks',        # Polish
-        'príloha',      # Slovak
-        'приложение',   # Bulgarian
-        'melléklet',    # Hungarian
-        'anexa',        # Romanian
-    ]
-    
-    # Roman numeral patterns (including Greek variants)
-    roman_patterns = [
-        r'[ivx]+',          # Standard: i, ii, iii, iv, v
-        r'[ιυχ]+',          # Greek: ι, ιι, ιιι
-        r'\d+',             # Arabic numbers: 1, 2, 3 (backup)
-    ]
-    
-    # Build comprehensive patterns for both word-first and number-first structures
-    all_patterns = []
-    
-    for base_word in annex_base_words:
-        for roman_pattern in roman_patterns:
-            # Pattern 1: Word first (e.g., "ANNEXE I", "BIJLAGE II")
-            all_patterns.append(rf'{re.escape(base_word)}\s*\.?\s*{roman_pattern}\.?')
-            
-            # Pattern 2: Number first (e.g., "I LISA", "II LISA") 
-            all_patterns.append(rf'{roman_pattern}\.?\s+{re.escape(base_word)}')
-            
-            # Pattern 3: Number with period first (e.g., "I. MELLÉKLET")
-            all_patterns.append(rf'{roman_pattern}\.\s*{re.escape(base_word)}')
+    # Every pattern and the base-word check need a base word in both texts;
+    # most paragraphs have none, so one alternation scan per text rejects them
+    if not (_ANNEX_WORDS_RE.search(text1) and _ANNEX_WORDS_RE.search(text2)):
+        return False
     
     # Check if both texts match any of the same patterns
-    for pattern in all_patterns:
-        if (re.search(pattern, text1, re.IGNORECASE) and 
-            re.search(pattern, text2, re.IGNORECASE)):
+    matches1 = {i for i, pattern in enumerate(_SIMILAR_HEADER_PATTERNS) if pattern.search(text1)}
+    if matches1:
+        matches2 = {i for i, pattern in enumerate(_SIMILAR_HEADER_PATTERNS) if pattern.search(text2)}
+        if matches1 & matches2:
             return True
     
     # Additional check: if both contain the same base word, they're similar
     text1_lower = text1.lower()
     text2_lower = text2.lower()
     
-    for base_word in annex_base_words:
-        if base_word.lower() in text1_lower and base_word.lower() in text2_lower:
-            return True
-    
-    return False
+    return any(word in text1_lower and word in text2_lower for word in _ANNEX_BASE_LOWER)
 
+@lru_cache(maxsize=4096)
 def _normalize_text_for_matching(text: str) -> str:
     """
     Normalize text for header matching by removing inconsistencies.
@@ -2457,23 +2706,40 @@ def _normalize_text_for_matching(text: str) -> str:
         Normalized text suitable for comparison
     """
     
-    # Convert to lowercase
-    normalized = text.lower()
-    
-    # Remove extra whitespace and normalize spaces
-    normalized = re.sub(r'\s+', ' ', normalized).strip()
-    
-    # Remove common punctuation that might vary
-    normalized = re.sub(r'[.,;:!?""''""()]', '', normalized)
-    
-    # Remove common formatting artifacts
-    normalized = re.sub(r'[\r\n\t]', ' ', normalized)
-    normalized = re.sub(r'\s+', ' ', normalized).strip()
+    if text.isascii():
+        # Most paragraphs are plain ASCII: lowercase and strip punctuation
+        # with the bytes methods, which are cheaper than the str equivalents
+        normalized = text.encode('ascii').lower().translate(None, _PUNCT_BYTES).decode('ascii')
+    else:
+        # Convert to lowercase
+        normalized = text.lower()
+        
+        # Remove common punctuation that might vary
+        normalized = normalized.translate(_PUNCT_TABLE)
     
-    return normalized
+    # Collapse all whitespace (including \r, \n, \t) to single spaces and trim
+    return ' '.join(normalized.split())
 
 
 
+def _append_paragraphs(dest_doc: Document, paragraphs: List[Paragraph]) -> None:
+    """
+    Append copies of source paragraphs to the end of a document body.
+
+    Paragraph XML is deep-copied directly in front of the body's sectPr.
+    Paragraphs that reference package parts fall back to copy_paragraph,
+    since their relationship IDs do not exist in the destination document.
+    """
+    sect_pr = dest_doc.element.body.sectPr
+    for para in paragraphs:
+        if _XP_HAS_REL_REF(para._element):
+            copy_paragraph(dest_doc, para)
+        elif sect_pr is not None:
+            sect_pr.addprevious(deepcopy(para._element))
+        else:
+            dest_doc.element.body.append(deepcopy(para._element))
+
+
 def split_annexes_original(source_path: str, output_dir: str, language: str, country: str, mapping_row: pd.Series) -> Tuple[str, str]:
     """
     Original splitting logic as fallback.
@@ -2487,21 +2753,27 @@ def split_annexes_original(source_path: str, output_dir: str, language: str, cou
     annex_iiib_doc = Document()
     
     current_section = None
+    annex_i_paras = []
+    annex_iiib_paras = []
     
     for para in doc.paragraphs:
-        text = para.text.strip()
+        text_upper = para.text.strip().upper()
         
         # Determine which section we're in using original logic
-        if 'ANNEX I' in text.upper() or 'SUMMARY OF PRODUCT CHARACTERISTICS' in text.upper():
+        if 'ANNEX I' in text_upper or 'SUMMARY OF PRODUCT CHARACTERISTICS' in text_upper:
             current_section = 'annex_i'
-        elif 'ANNEX III' in text.upper() or 'PACKAGE LEAFLET' in text.upper():
+        elif 'ANNEX III' in text_upper or 'PACKAGE LEAFLET' in text_upper:
             current_section = 'annex_iiib'
         
-        # Copy paragraph to appropriate document
+        # Collect paragraph for the appropriate document
         if current_section == 'annex_i':
-            copy_paragraph(annex_i_doc, para)
+            annex_i_paras.append(para)
         elif current_section == 'annex_iiib':
-            copy_paragraph(annex_iiib_doc, para)
+            annex_iiib_paras.append(para)
+    
+    # Copy each section in one pass
+    _append_paragraphs(annex_i_doc, annex_i_paras)
+    _append_paragraphs(annex_iiib_doc, annex_iiib_paras)
     
     # Generate output paths
     base_name = Path(source_path).stem
@@ -2512,8 +2784,8 @@ def split_annexes_original(source_path: str, output_dir: str, language: str, cou
     annex_iiib_path = os.path.join(output_dir, annex_iiib_filename)
     
     # Save documents
-    annex_i_doc.save(annex_i_path)
-    annex_iiib_doc.save(annex_iiib_path)
+    _save_document(annex_i_doc, annex_i_path)
+    _save_document(annex_iiib_doc, annex_iiib_path)
     
     return annex_i_path, annex_iiib_path
 
@@ -2521,13 +2793,71 @@ def split_annexes_original(source_path: str, output_dir: str, language: str, cou
 # ENHANCED PROCESSOR CLASSES
 # =============================================================================
 
+# Output directories already created in this process
+_created_dirs: set = set()
+
+
+def _ensure_directory(path: Path) -> None:
+    """
+    Create a directory and its parents unless this process already did.
+
+    A known directory costs one stat to confirm it still exists, instead of
+    makedirs walking and re-creating every path component.
+    """
+    key = os.path.abspath(path)
+    if key in _created_dirs and os.path.isdir(key):
+        return
+    os.makedirs(key, exist_ok=True)
+    # set.add is atomic, so concurrent callers at worst both create the directory
+    _created_dirs.add(key)
+
+
+def _copy_file_fast(src: Path, dst: Path) -> None:
+    """
+    Copy a file with its metadata, letting the kernel do the data copy.
+
+    os.copy_file_range keeps the copy in kernel space and becomes a reflink
+    on filesystems that support it. Platforms or filesystems without it
+    fall back to shutil.copy2.
+    """
+    copy_file_range = getattr(os, 'copy_file_range', None)
+    if copy_file_range is None:
+        shutil.copy2(src, dst)
+        return
+    
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        shutil.copystat(src, dst)
+    except OSError:
+        # Unsupported across these filesystems (EXDEV, ENOSYS, ...)
+        shutil.copy2(src, dst)
+
+
 class FileManager:
     """Handles file operations and path management."""
     
+    # One pattern for all name rules: a .docx suffix (any case) after at least
+    # one character, no temp/annex prefix and no annex marker
+    _PROCESSABLE_NAME_RE = re.compile(
+        r'(?s)^(?!{temp}|{prefix})(?!.*{marker}).+\.(?i:docx)\Z'.format(
+            temp=re.escape(FileMarkers.TEMP_FILE_PREFIX),
+            prefix=re.escape(FileMarkers.ANNEX_PREFIX),
+            marker=re.escape(FileMarkers.ANNEX_MARKER),
+        )
+    )
+    
     def __init__(self, base_folder: Path, config: ProcessingConfig):
         self.base_folder = base_folder
         self.config = config
         self.logger = logging.getLogger(f"{__name__}.FileManager")
+        # Backups known to exist in this run, keyed by source path
+        self._backups: Dict[Path, Path] = {}
     
     def setup_output_directories(self) -> Tuple[Path, Path]:
         """Create and return paths for output directories."""
@@ -2535,47 +2865,59 @@ class FileManager:
         pdf_dir = self.base_folder / DirectoryNames.PDF_DOCS
         
         try:
-            os.makedirs(split_dir, exist_ok=True)
-            os.makedirs(pdf_dir, exist_ok=True)
+            _ensure_directory(split_dir)
+            _ensure_directory(pdf_dir)
             return split_dir, pdf_dir
         except OSError as e:
             raise ProcessingError(f"Failed to create output directories: {e}")
     
     def discover_processable_documents(self) -> List[Path]:
         """Find all valid Word documents that can be processed."""
-        if not self.base_folder.is_dir():
-            raise ValidationError(f"Folder does not exist: {self.base_folder}")
-        
+        # scandir entries carry the name and file type from the directory
+        # listing, so filtering needs no per-file stat or Path construction.
+        # Opening the directory also validates it, without a separate stat.
         documents = []
-        for file_path in self.base_folder.iterdir():
-            if self._is_processable_document(file_path):
-                documents.append(file_path)
+        try:
+            with os.scandir(self.base_folder) as entries:
+                for entry in entries:
+                    if self._is_processable_document(entry.name) and entry.is_file():
+                        documents.append(Path(entry.path))
+        except (FileNotFoundError, NotADirectoryError):
+            raise ValidationError(f"Folder does not exist: {self.base_folder}")
         
         return documents
     
-    def _is_processable_document(self, file_path: Path) -> bool:
-        """Check if a file is a valid document for processing."""
-        if file_path.suffix.lower() != ".docx":
-            return False
-        if file_path.name.startswith(FileMarkers.TEMP_FILE_PREFIX):
-            return False
-        if FileMarkers.ANNEX_MARKER in file_path.name:
-            return False
-        if file_path.name.startswith(FileMarkers.ANNEX_PREFIX):
-            return False
-        return True
+    def _is_processable_document(self, file_name: str) -> bool:
+        """Check if a file name is a valid document for processing."""
+        return self._PROCESSABLE_NAME_RE.match(file_name) is not None
     
     def create_backup(self, file_path: Path) -> Optional[Path]:
         """Create a backup of the original file."""
         if not self.config.create_backups:
             return None
+        
+        # Backups are never removed during a run, so a hit needs no stat
+        backup_path = self._backups.get(file_path)
+        if backup_path is not None:
+            return backup_path
             
         backup_path = file_path.with_suffix(file_path.suffix + DirectoryNames.BACKUP_SUFFIX)
         if backup_path.exists():
+            self._backups[file_path] = backup_path
             return backup_path
             
         try:
-            shutil.copy2(file_path, backup_path)
+            if self.config.link_backups:
+                # The source is never written to, so a hard link preserves
+                # it without copying any data
+                try:
+                    os.link(file_path, backup_path)
+                except OSError:
+                    # Different filesystem or no hard-link support
+                    _copy_file_fast(file_path, backup_path)
+            else:
+                _copy_file_fast(file_path, backup_path)
+            self._backups[file_path] = backup_path
             return backup_path
         except Exception:
             return None
@@ -2624,10 +2966,16 @@ class DocumentUpdater:
 class DocumentProcessor:
     """Main document processing orchestrator."""
     
+    # Banner separators for the progress log
+    _SEP = "=" * 80
+    _SUB_SEP = "=" * 60
+    
     def __init__(self, config: Optional[ProcessingConfig] = None):
         self.config = config or ProcessingConfig()
         self.stats = ProcessingStats()
         self.logger = self._setup_logging()
+        # Stateless apart from config, so one instance serves every variant
+        self.updater = DocumentUpdater(self.config)
         
     def _setup_logging(self) -> logging.Logger:
         """Set up logging configuration."""
@@ -2647,9 +2995,9 @@ class DocumentProcessor:
     def process_folder(self, folder_path: str, mapping_path: str) -> ProcessingResult:
         """Main entry point for processing a folder of documents."""
         try:
-            self.logger.info("=" * 80)
+            self.logger.info(self._SEP)
             self.logger.info("🚀 STARTING ENHANCED DOCUMENT PROCESSING")
-            self.logger.info("=" * 80)
+            self.logger.info(self._SEP)
             
             # Validate inputs
             folder = self._validate_folder_path(folder_path)
@@ -2674,17 +3022,22 @@ class DocumentProcessor:
                 )
             
             # Process each document
-            output_files = []
-            for document_path in documents:
-                try:
-                    result = self._process_single_document(
-                        document_path, mapping_df, file_manager, split_dir, pdf_dir, mapping_path
-                    )
-                    output_files.extend(result.output_files)
+            if self.config.parallel_documents and len(documents) > 1:
+                output_files = self._process_documents_parallel(
+                    documents, folder, split_dir, pdf_dir, mapping_path
+                )
+            else:
+                output_files = []
+                for document_path in documents:
+                    try:
+                        result = self._process_single_document(
+                            document_path, mapping_df, file_manager, split_dir, pdf_dir, mapping_path
+                        )
+                        output_files.extend(result.output_files)
 
-                except Exception as e:
-                    self.logger.error(f"Error processing {document_path.name}: {e}")
-                    self.stats.errors_encountered += 1
+                    except Exception as e:
+                        self.logger.error("Error processing %s: %s", document_path.name, e)
+                        self.stats.errors_encountered += 1
 
             # NEW: Batch convert PDFs after all document processing
             if self.config.convert_to_pdf and not self.config.skip_pdf_in_background:
@@ -2693,19 +3046,67 @@ class DocumentProcessor:
                 self.stats.output_files_created += len(pdf_files)
             elif self.config.convert_to_pdf and self.config.skip_pdf_in_background:
                 self.logger.info("📄 PDF conversion skipped (running in background context)")
-                self.logger.info(f"📄 {len(getattr(self, '_pending_pdf_conversions', []))} documents queued for manual PDF conversion")
+                self.logger.info("📄 %s documents queued for manual PDF conversion", len(getattr(self, '_pending_pdf_conversions', [])))
 
             # Generate final report
             return self._generate_final_result(output_files)
             
         except Exception as e:
-            self.logger.error(f"Fatal error in process_folder: {e}")
+            self.logger.error("Fatal error in process_folder: %s", e)
             return ProcessingResult(
                 success=False,
                 message=f"Processing failed: {e}",
                 errors=[str(e)]
             )
     
+    def _process_documents_parallel(
+        self,
+        documents: List[Path],
+        folder: Path,
+        split_dir: Path,
+        pdf_dir: Path,
+        mapping_path: str
+    ) -> List[str]:
+        """Process documents in worker processes and merge their results."""
+        workers = self.config.document_workers or max(1, (os.cpu_count() or 2) - 1)
+        workers = min(workers, len(documents))
+        self.logger.info("⚙️ Processing %s documents with %s worker processes", len(documents), workers)
+        
+        output_files = []
+        pending = getattr(self, '_pending_pdf_conversions', [])
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_document_worker,
+            initargs=(self.config, mapping_path)
+        ) as executor:
+            futures = [
+                (document_path, executor.submit(
+                    _process_document_in_worker, document_path, folder, split_dir, pdf_dir
+                ))
+                for document_path in documents
+            ]
+            
+            # Merge in submission order so output lists stay deterministic
+            for document_path, future in futures:
+                try:
+                    result, stats, conversions = future.result()
+                except Exception as e:
+                    self.logger.error("Error processing %s: %s", document_path.name, e)
+                    self.stats.errors_encountered += 1
+                    continue
+                
+                output_files.extend(result.output_files)
+                pending.extend(conversions)
+                self.stats.input_files_processed += stats.input_files_processed
+                self.stats.variants_processed += stats.variants_processed
+                self.stats.variants_successful += stats.variants_successful
+                self.stats.output_files_created += stats.output_files_created
+                self.stats.errors_encountered += stats.errors_encountered
+        
+        if pending:
+            self._pending_pdf_conversions = pending
+        return output_files
+    
     def _validate_folder_path(self, folder_path: str) -> Path:
         """Validate and return folder path."""
         folder = Path(folder_path).resolve()
@@ -2716,11 +3117,13 @@ class DocumentProcessor:
     def _load_and_validate_mapping(self, mapping_path: str) -> pd.DataFrame:
         """Load and validate mapping file."""
         try:
-            mapping_df = load_mapping_table(mapping_path)
+            mapping_df = load_mapping_table_cached(mapping_path)
             if mapping_df is None or mapping_df.empty:
                 raise MappingError(f"Could not load mapping file: {mapping_path}")
             
-            self.logger.info(f"Mapping loaded: {len(mapping_df)} configurations")
+            self.logger.info("Mapping loaded: %s configurations", len(mapping_df))
+            # Group once so each document's variant lookup is a dict access
+            self._rows_by_language = group_mapping_rows_by_language(mapping_df)
             return mapping_df
             
         except Exception as e:
@@ -2737,9 +3140,9 @@ class DocumentProcessor:
     ) -> ProcessingResult:
         """Process a single document with all its variants."""
         
-        self.logger.info("=" * 60)
-        self.logger.info(f"📄 PROCESSING: {document_path.name}")
-        self.logger.info("=" * 60)
+        self.logger.info(self._SUB_SEP)
+        self.logger.info("📄 PROCESSING: %s", document_path.name)
+        self.logger.info(self._SUB_SEP)
         
         self.stats.input_files_processed += 1
         
@@ -2752,50 +3155,69 @@ class DocumentProcessor:
                 self.logger.error(error_msg)
                 return ProcessingResult(success=False, message=error_msg)
             
-            self.logger.info(f"Document identified - Language: {language_name}, Country: {country_name}")
+            self.logger.info("Document identified - Language: %s, Country: %s", language_name, country_name)
             
             # Find mapping rows for this language
-            mapping_rows = find_mapping_rows_for_language(mapping_df, language_name)
+            rows_by_language = getattr(self, '_rows_by_language', None)
+            if rows_by_language is not None:
+                mapping_rows = rows_by_language.get(language_name.lower(), [])
+            else:
+                mapping_rows = find_mapping_rows_for_language(mapping_df, language_name)
             if not mapping_rows:
                 error_msg = f"No mapping found for language: {language_name}"
                 self.logger.error(error_msg)
                 return ProcessingResult(success=False, message=error_msg)
             
-            self.logger.info(f"Found {len(mapping_rows)} variant(s) to process")
+            self.logger.info("Found %s variant(s) to process", len(mapping_rows))
             
             # Create backup
             file_manager.create_backup(document_path)
             
+            # Parse the source once; variants work on copies of this tree.
+            # If it fails, each variant loads (and reports) the file itself.
+            try:
+                base_doc = Document(str(document_path))
+            except Exception:
+                base_doc = None
+            
             # Process each variant
             output_files = []
             variant_success_count = 0
             
             for i, mapping_row in enumerate(mapping_rows, 1):
+                # Updates read dozens of fields per variant; a plain dict
+                # snapshot makes each read a hash lookup instead of Series indexing
+                mapping_row = mapping_row.to_dict()
                 country = mapping_row['Country']
-                self.logger.info(f"🌍 Processing variant {i}/{len(mapping_rows)}: {country}")
+                self.logger.info("🌍 Processing variant %s/%s: %s", i, len(mapping_rows), country)
+                
+                # The last variant can modify the parsed tree directly
+                variant_doc = base_doc
+                if base_doc is not None and i < len(mapping_rows):
+                    variant_doc = deepcopy(base_doc)
                 
                 try:
                     result = self._process_document_variant(
-                        document_path, mapping_row, split_dir, pdf_dir, mapping_path
+                        document_path, mapping_row, split_dir, pdf_dir, mapping_path, variant_doc
                     )
                     
                     if result.success:
                         variant_success_count += 1
                         self.stats.variants_successful += 1
                         output_files.extend(result.output_files)
-                        self.logger.info(f"✅ Variant {i} completed successfully")
+                        self.logger.info("✅ Variant %s completed successfully", i)
                     else:
-                        self.logger.warning(f"⚠️ Variant {i} completed with issues: {result.message}")
+                        self.logger.warning("⚠️ Variant %s completed with issues: %s", i, result.message)
                     
                     self.stats.variants_processed += 1
                     
                 except Exception as e:
-                    self.logger.error(f"❌ Error processing variant {i} ({country}): {e}")
+                    self.logger.error("❌ Error processing variant %s (%s): %s", i, country, e)
                     self.stats.errors_encountered += 1
             
             # Document summary
             success_rate = (variant_success_count / len(mapping_rows)) * 100 if mapping_rows else 0
-            self.logger.info(f"📊 Document Summary: {variant_success_count}/{len(mapping_rows)} variants successful ({success_rate:.1f}%)")
+            self.logger.info("📊 Document Summary: %s/%s variants successful (%.1f%%)", variant_success_count, len(mapping_rows), success_rate)
             
             return ProcessingResult(
                 success=variant_success_count > 0,
@@ -2804,7 +3226,7 @@ class DocumentProcessor:
             )
             
         except Exception as e:
-            self.logger.error(f"Error processing document {document_path.name}: {e}")
+            self.logger.error("Error processing document %s: %s", document_path.name, e)
             return ProcessingResult(success=False, message=str(e), errors=[str(e)])
     
     def _process_document_variant(
@@ -2813,20 +3235,21 @@ class DocumentProcessor:
         mapping_row: pd.Series,
         split_dir: Path,
         pdf_dir: Path,
-        mapping_path: str
+        mapping_path: str,
+        doc: Optional[Document] = None
     ) -> ProcessingResult:
-        """Process a single document variant."""
+        """Process a single document variant, optionally on an already parsed copy."""
         
         country = mapping_row['Country']
         language = mapping_row['Language']
         
         try:
             # Load document
-            doc = Document(str(document_path))
+            if doc is None:
+                doc = Document(str(document_path))
             
             # Apply updates
-            updater = DocumentUpdater(self.config)
-            updates_made, updates_applied = updater.apply_all_updates(doc, mapping_row, mapping_path)
+            updates_made, updates_applied = self.updater.apply_all_updates(doc, mapping_row, mapping_path)
             
             if not updates_made:
                 return ProcessingResult(
@@ -2834,44 +3257,15 @@ class DocumentProcessor:
                     message=f"No updates applied for {country} variant"
                 )
             
-            # Save and process updated document - use synchronous wrapper
-            return self._save_and_split_document_sync(
+            # Save and process updated document
+            return self._save_and_split_document(
                 doc, document_path, mapping_row, split_dir, pdf_dir, updates_applied
             )
             
         except Exception as e:
             raise DocumentError(f"Failed to process variant for {country}: {e}")
 
-    def _save_and_split_document_sync(
-        self,
-        doc: Document,
-        original_path: Path,
-        mapping_row: pd.Series,
-        split_dir: Path,
-        pdf_dir: Path,
-        updates_applied: List[str]
-    ) -> ProcessingResult:
-        """Synchronous wrapper that calls async version."""
-        import asyncio
-        print(f"🔧 DEBUG: Starting _save_and_split_document_sync for {mapping_row['Country']}")
-        print(f"🔧 DEBUG: Updates applied: {updates_applied}")
-        print(f"🔧 DEBUG: Document path: {original_path}")
-        print(f"🔧 DEBUG: Split dir: {split_dir}")
-        print(f"🔧 DEBUG: PDF dir: {pdf_dir}")
-
-        # Run the async version in a new event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(
-                self._save_and_split_document(
-                    doc, original_path, mapping_row, split_dir, pdf_dir, updates_applied
-                )
-            )
-        finally:
-            loop.close()
-
-    async def _save_and_split_document(
+    def _save_and_split_document(
         self,
         doc: Document,
         original_path: Path,
@@ -2886,7 +3280,11 @@ class DocumentProcessor:
         language = mapping_row['Language']
         output_files = []
 
-        print(f"🔧 DEBUG: Entering async _save_and_split_document for {country}")
+        print(f"🔧 DEBUG: Entering _save_and_split_document for {country}")
+        print(f"🔧 DEBUG: Updates applied: {updates_applied}")
+        print(f"🔧 DEBUG: Document path: {original_path}")
+        print(f"🔧 DEBUG: Split dir: {split_dir}")
+        print(f"🔧 DEBUG: PDF dir: {pdf_dir}")
         print(f"🔧 DEBUG: Document has {len(doc.paragraphs)} paragraphs")
         
         try:
@@ -2900,10 +3298,10 @@ class DocumentProcessor:
 
             # Save updated document
             print(f"🔧 DEBUG: About to save document...")
-            doc.save(str(output_path))
+            _save_document(doc, output_path)
             print(f"🔧 DEBUG: Document saved successfully!")
             output_files.append(str(output_path))
-            self.logger.info(f"💾 Saved combined document: {output_filename}")
+            self.logger.info("💾 Saved combined document: %s", output_filename)
             
             # Split into annexes
             print(f"🔧 DEBUG: About to start splitting into annexes...")
@@ -2914,7 +3312,7 @@ class DocumentProcessor:
             print(f"🔧 DEBUG: Split completed successfully!")
 
             output_files.extend([annex_i_path, annex_iiib_path])
-            self.logger.info(f"✅ Split completed")
+            self.logger.info("✅ Split completed")
             
             # Store paths for later PDF conversion (don't convert yet)
             if self.config.convert_to_pdf:
@@ -2922,7 +3320,7 @@ class DocumentProcessor:
                     self._pending_pdf_conversions = []
                 self._pending_pdf_conversions.append((annex_i_path, str(pdf_dir)))
                 self._pending_pdf_conversions.append((annex_iiib_path, str(pdf_dir)))
-                self.logger.info(f"📄 Queued 2 documents for batch PDF conversion")
+                self.logger.info("📄 Queued 2 documents for batch PDF conversion")
             
             self.stats.output_files_created += len(output_files)
             
@@ -2944,46 +3342,114 @@ class DocumentProcessor:
         if not hasattr(self, '_pending_pdf_conversions') or not self._pending_pdf_conversions:
             return []
 
-        self.logger.info("=" * 80)
-        self.logger.info(f"📄 Starting batch PDF conversion for {len(self._pending_pdf_conversions)} documents...")
-        self.logger.info("=" * 80)
+        self.logger.info(self._SEP)
+        self.logger.info("📄 Starting batch PDF conversion for %s documents...", len(self._pending_pdf_conversions))
+        self.logger.info(self._SEP)
 
         pdf_files = []
         successful = 0
         failed = 0
+        total = len(self._pending_pdf_conversions)
+        batches = self._group_pdf_batches(self._pending_pdf_conversions,
+                                          max(1, self.config.pdf_batch_size))
+        workers = min(self.config.pdf_workers, len(batches))
+
+        if workers > 1:
+            # One LibreOffice worker per pool thread so queued conversions
+            # do not sit behind each other and hit the converter timeout
+            ThreadSafePDFConverter().ensure_workers(workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._convert_pdf_batch, doc_paths, output_dir)
+                    for output_dir, doc_paths in batches
+                ]
+                idx = 0
+                for future in as_completed(futures):
+                    for doc_path, pdf_path, error in future.result():
+                        idx += 1
+                        if error is None:
+                            pdf_files.append(pdf_path)
+                            successful += 1
+                            self.logger.info("✅ Success %s/%s: %s", idx, total, os.path.basename(pdf_path))
+                        else:
+                            failed += 1
+                            self.logger.warning("❌ Failed %s/%s: %s - %s", idx, total, os.path.basename(doc_path), error)
+        else:
+            idx = 0
+            for output_dir, doc_paths in batches:
+                if len(doc_paths) == 1:
+                    self.logger.info("🔄 Converting %s/%s: %s", idx + 1, total, os.path.basename(doc_paths[0]))
+                else:
+                    self.logger.info("🔄 Converting %s-%s/%s: %s documents in %s",
+                                     idx + 1, idx + len(doc_paths), total, len(doc_paths), output_dir)
+                idx += len(doc_paths)
+                for doc_path, pdf_path, error in self._convert_pdf_batch(doc_paths, output_dir):
+                    if error is None:
+                        pdf_files.append(pdf_path)
+                        successful += 1
+                        self.logger.info("✅ Success: %s", os.path.basename(pdf_path))
+                    else:
+                        failed += 1
+                        self.logger.warning("❌ Failed: %s - %s", os.path.basename(doc_path), error)
 
-        for idx, (doc_path, output_dir) in enumerate(self._pending_pdf_conversions, 1):
-            self.logger.info(f"🔄 Converting {idx}/{len(self._pending_pdf_conversions)}: {Path(doc_path).name}")
-            try:
-                pdf_path = convert_to_pdf(doc_path, output_dir)
-                pdf_files.append(pdf_path)
-                successful += 1
-                self.logger.info(f"✅ Success: {Path(pdf_path).name}")
-            except Exception as e:
-                failed += 1
-                self.logger.warning(f"❌ Failed: {Path(doc_path).name} - {e}")
-
-        self.logger.info("=" * 80)
-        self.logger.info(f"📄 Batch PDF conversion complete: {successful} successful, {failed} failed")
-        self.logger.info("=" * 80)
+        self.logger.info(self._SEP)
+        self.logger.info("📄 Batch PDF conversion complete: %s successful, %s failed", successful, failed)
+        self.logger.info(self._SEP)
 
         return pdf_files
 
+    @staticmethod
+    def _group_pdf_batches(conversions: List[Tuple[str, str]],
+                           batch_size: int) -> List[Tuple[str, List[str]]]:
+        """Group pending conversions by output directory into batches of at most batch_size."""
+        by_dir: Dict[str, List[str]] = {}
+        for doc_path, output_dir in conversions:
+            by_dir.setdefault(output_dir, []).append(doc_path)
+        return [
+            (output_dir, doc_paths[start:start + batch_size])
+            for output_dir, doc_paths in by_dir.items()
+            for start in range(0, len(doc_paths), batch_size)
+        ]
+
+    def _convert_pdf_batch(self, doc_paths: List[str],
+                           output_dir: str) -> List[Tuple[str, Optional[str], Optional[Exception]]]:
+        """
+        Convert one batch to PDF, returning (doc_path, pdf_path, error) per document.
+
+        The whole batch goes through a single LibreOffice run; if that fails,
+        each document is retried through convert_to_pdf and its fallbacks.
+        """
+        if len(doc_paths) > 1:
+            status, result = ThreadSafePDFConverter().convert_batch(doc_paths, output_dir)
+            if status == "success":
+                return [(doc_path, pdf_path, None) for doc_path, pdf_path in zip(doc_paths, result)]
+            self.logger.warning("⚠️ Batch conversion failed, converting %s documents individually: %s",
+                                len(doc_paths), result)
+
+        outcomes = []
+        for doc_path in doc_paths:
+            try:
+                outcomes.append((doc_path, convert_to_pdf(doc_path, output_dir), None))
+            except Exception as e:
+                outcomes.append((doc_path, None, e))
+        return outcomes
+
     def _generate_final_result(self, output_files: List[str]) -> ProcessingResult:
         """Generate final processing result with statistics."""
         
-        self.logger.info("=" * 80)
+        self.logger.info(self._SEP)
         self.logger.info("✅ ENHANCED PROCESSING COMPLETE")
-        self.logger.info("=" * 80)
+        self.logger.info(self._SEP)
         
-        self.logger.info("📊 Final Statistics:")
-        self.logger.info(f"   Input files found: {self.stats.input_files_found}")
-        self.logger.info(f"   Input files processed: {self.stats.input_files_processed}")
-        self.logger.info(f"   Total variants processed: {self.stats.variants_processed}")
-        self.logger.info(f"   Successful variants: {self.stats.variants_successful}")
-        self.logger.info(f"   Success rate: {self.stats.success_rate():.1f}%")
-        self.logger.info(f"   Output files created: {self.stats.output_files_created}")
-        self.logger.info(f"   Errors encountered: {self.stats.errors_encountered}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("📊 Final Statistics:")
+            self.logger.info("   Input files found: %s", self.stats.input_files_found)
+            self.logger.info("   Input files processed: %s", self.stats.input_files_processed)
+            self.logger.info("   Total variants processed: %s", self.stats.variants_processed)
+            self.logger.info("   Successful variants: %s", self.stats.variants_successful)
+            self.logger.info("   Success rate: %.1f%%", self.stats.success_rate())
+            self.logger.info("   Output files created: %s", self.stats.output_files_created)
+            self.logger.info("   Errors encountered: %s", self.stats.errors_encountered)
         
         success = self.stats.variants_successful > 0
         message = f"Processed {self.stats.variants_successful}/{self.stats.variants_processed} variants successfully"
@@ -2998,6 +3464,49 @@ class DocumentProcessor:
             pending_pdf_conversions=pending_conversions
         )
 
+# =============================================================================
+# PARALLEL DOCUMENT WORKERS
+# =============================================================================
+
+# Per-process state, set up once by the pool initializer so the mapping table
+# is loaded in each worker instead of being pickled with every task
+_WORKER_PROCESSOR: Optional[DocumentProcessor] = None
+_WORKER_MAPPING_DF: Optional[pd.DataFrame] = None
+_WORKER_MAPPING_PATH: Optional[str] = None
+
+
+def _init_document_worker(config: ProcessingConfig, mapping_path: str) -> None:
+    """Load the mapping table and date formats once per worker process."""
+    global _WORKER_PROCESSOR, _WORKER_MAPPING_DF, _WORKER_MAPPING_PATH
+    
+    _WORKER_PROCESSOR = DocumentProcessor(config)
+    _WORKER_MAPPING_DF = _WORKER_PROCESSOR._load_and_validate_mapping(mapping_path)
+    _WORKER_MAPPING_PATH = mapping_path
+    initialize_date_formatter(mapping_path)
+
+
+def _process_document_in_worker(
+    document_path: Path,
+    folder: Path,
+    split_dir: Path,
+    pdf_dir: Path
+) -> Tuple[ProcessingResult, ProcessingStats, List[Tuple[str, str]]]:
+    """
+    Process one document in a worker process.
+    
+    Returns the document result together with the statistics and queued PDF
+    conversions it produced, for the parent process to merge.
+    """
+    processor = _WORKER_PROCESSOR
+    processor.stats = ProcessingStats()
+    processor._pending_pdf_conversions = []
+    
+    file_manager = FileManager(folder, processor.config)
+    result = processor._process_single_document(
+        document_path, _WORKER_MAPPING_DF, file_manager, split_dir, pdf_dir, _WORKER_MAPPING_PATH
+    )
+    return result, processor.stats, processor._pending_pdf_conversions
+
 # ============================================================================= 
 # BACKWARDS COMPATIBILITY INTERFACE
 # =============================================================================
@@ -1,7 +1,9 @@
 """Core utility functions for the regulatory processor."""
 
+import importlib.util
 import os
 import re
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import pandas as pd
@@ -67,6 +69,14 @@ def find_mapping_rows_for_language(mapping_df: pd.DataFrame, language_name: str)
     return [language_matches.iloc[i] for i in range(len(language_matches))]
 
 
+def group_mapping_rows_by_language(mapping_df: pd.DataFrame) -> Dict[str, List[pd.Series]]:
+    """Group mapping rows by lowercased language for repeated lookups."""
+    return {
+        language: [group.iloc[i] for i in range(len(group))]
+        for language, group in mapping_df.groupby(mapping_df['Language'].str.lower(), sort=False)
+    }
+
+
 # =============================================================================
 # FILE NAMING AND PATH UTILITIES
 # =============================================================================
@@ -89,6 +99,11 @@ def generate_output_filename(base_name: str, language: str, country: str, doc_ty
 # MAPPING TABLE UTILITIES
 # =============================================================================
 
+# Read the mapping workbook with the Rust-backed calamine engine when
+# python-calamine is installed; otherwise pandas picks its default (openpyxl)
+_EXCEL_ENGINE = 'calamine' if importlib.util.find_spec('python_calamine') else None
+
+
 def load_mapping_table(file_path: str) -> Optional[pd.DataFrame]:
     """Load the Excel mapping table."""
     try:
@@ -97,7 +112,11 @@ def load_mapping_table(file_path: str) -> Optional[pd.DataFrame]:
             print(f"❌ Error: Mapping file not found: {file_path}")
             return None
 
-        df = pd.read_excel(path)
+        df = pd.read_excel(path, engine=_EXCEL_ENGINE)
+        # Interned column names are shared by every row dict built from this
+        # table, so lookups with identifier-like literals ('Country',
+        # 'Language') match on identity before comparing characters
+        df.columns = [sys.intern(c) if isinstance(c, str) else c for c in df.columns]
 
         print(f"✅ Successfully loaded mapping table: {path.name}")
         print(f"   - Rows: {len(df)}")
@@ -110,6 +129,33 @@ def load_mapping_table(file_path: str) -> Optional[pd.DataFrame]:
         return None
 
 
+# Parsed mapping tables keyed by absolute path, with the (mtime_ns, size)
+# they were read at. Failed loads are not cached so a locked file is retried.
+_mapping_table_cache: Dict[str, Tuple[int, int, pd.DataFrame]] = {}
+
+
+def load_mapping_table_cached(file_path: str) -> Optional[pd.DataFrame]:
+    """
+    Load the Excel mapping table, reusing the parsed table while the file is unchanged.
+
+    The returned DataFrame is shared between callers and must not be modified.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return load_mapping_table(file_path)
+
+    key = os.path.abspath(file_path)
+    cached = _mapping_table_cache.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    df = load_mapping_table(file_path)
+    if df is not None:
+        _mapping_table_cache[key] = (stat.st_mtime_ns, stat.st_size, df)
+    return df
+
+
 # =============================================================================
 # TEXT NORMALIZATION UTILITIES
 # =============================================================================